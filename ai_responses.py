@@ -14,11 +14,31 @@ from tweet_models import Tweet, TweetAnalysisResult, create_tweets_from_search_r
 
 logger = logging.getLogger(__name__)
 
+def _keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """Compile keywords into one case-insensitive substring pattern"""
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+# Intent keyword patterns, checked in order by _analyze_intent (substring matches, like 'pray' in 'praying')
+_INTENT_PATTERNS = [
+    # Prayer request patterns
+    ('prayer_request', _keyword_pattern(['pray', 'prayer', 'prayers', 'praying', 'please pray', 'need prayer'])),
+    # Verse request patterns
+    ('verse_request', _keyword_pattern(['verse', 'bible', 'scripture', 'word', 'passage'])),
+    # Encouragement/comfort patterns
+    ('comfort_needed', _keyword_pattern(['struggling', 'difficult', 'hard time', 'depressed', 'anxious', 'worried', 'scared', 'hurt', 'pain', 'lost', 'confused'])),
+    # Gratitude/praise patterns
+    ('gratitude', _keyword_pattern(['thank', 'grateful', 'blessed', 'praise', 'amazing', 'wonderful', 'glory'])),
+]
+_QUESTION_START_RE = re.compile(r'(what|how|why|when|where|who)', re.IGNORECASE)
+
+# Returned by generate_daily_post_text when the AI call fails
+DEFAULT_DAILY_POST_TEXT = "May this verse bless your day! 🙏"
+
 class AIResponseGenerator:
     def __init__(self):
         # Debug config loading
-        logger.info(f"Loading AI config - API key present: {bool(getattr(config, 'OPENAI_API_KEY', None))}")
-        logger.info(f"AI Model: {getattr(config, 'AI_MODEL', 'NOT_SET')}")
+        logger.info("Loading AI config - API key present: %s", bool(getattr(config, 'OPENAI_API_KEY', None)))
+        logger.info("AI Model: %s", getattr(config, 'AI_MODEL', 'NOT_SET'))
         
         # Validate API key
         api_key = getattr(config, 'OPENAI_API_KEY', None)
@@ -31,7 +51,7 @@ class AIResponseGenerator:
             self.client = OpenAI(api_key=api_key)
             logger.info("OpenAI client initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize OpenAI client: {e}")
+            logger.error("Failed to initialize OpenAI client: %s", e)
             raise
             
         self.model = getattr(config, 'AI_MODEL', 'gpt-4o-mini')
@@ -119,39 +139,22 @@ Remember: You represent Christ's love in every interaction. Be authentic, caring
             # Post-process the response
             formatted_response = self._format_response(generated_text)
             
-            logger.info(f"Generated response: {formatted_response}")
+            logger.info("Generated response: %s", formatted_response)
             return formatted_response
             
         except Exception as e:
-            logger.error(f"Failed to generate AI response: {e}")
+            logger.error("Failed to generate AI response: %s", e)
             return self._get_fallback_response(mention_text)
 
     def _analyze_intent(self, text: str) -> str:
         """Analyze the intent of the mention"""
-        text_lower = text.lower()
-        
-        # Prayer request patterns
-        prayer_keywords = ['pray', 'prayer', 'prayers', 'praying', 'please pray', 'need prayer']
-        if any(keyword in text_lower for keyword in prayer_keywords):
-            return 'prayer_request'
-        
-        # Verse request patterns
-        verse_keywords = ['verse', 'bible', 'scripture', 'word', 'passage']
-        if any(keyword in text_lower for keyword in verse_keywords):
-            return 'verse_request'
-        
-        # Encouragement/comfort patterns
-        comfort_keywords = ['struggling', 'difficult', 'hard time', 'depressed', 'anxious', 'worried', 'scared', 'hurt', 'pain', 'lost', 'confused']
-        if any(keyword in text_lower for keyword in comfort_keywords):
-            return 'comfort_needed'
-        
-        # Gratitude/praise patterns
-        praise_keywords = ['thank', 'grateful', 'blessed', 'praise', 'amazing', 'wonderful', 'glory']
-        if any(keyword in text_lower for keyword in praise_keywords):
-            return 'gratitude'
+        # Case-insensitive patterns, so no lowercased copy of the text is needed
+        for intent, pattern in _INTENT_PATTERNS:
+            if pattern.search(text):
+                return intent
         
         # Question patterns
-        if '?' in text or text_lower.startswith(('what', 'how', 'why', 'when', 'where', 'who')):
+        if '?' in text or _QUESTION_START_RE.match(text):
             return 'question'
         
         return 'general'
@@ -327,8 +330,8 @@ David, a major writer of the book of Psalms, explains that you should not put yo
             return generated_text.strip('"\'')
             
         except Exception as e:
-            logger.error(f"Failed to generate daily post text: {e}")
-            return "May this verse bless your day! 🙏"
+            logger.error("Failed to generate daily post text: %s", e)
+            return DEFAULT_DAILY_POST_TEXT
 
     def select_and_respond_to_tweet(self, tweets: List[Dict]) -> Optional[TweetAnalysisResult]:
         """Analyze a list of tweets and select the best one to respond to with a Bible verse
@@ -350,7 +353,7 @@ David, a major writer of the book of Psalms, explains that you should not put yo
                 logger.info("No tweets provided for analysis")
                 return None
             
-            logger.info(f"🔍 Starting 4-step analysis of {len(tweets)} tweets")
+            logger.info("🔍 Starting 4-step analysis of %s tweets", len(tweets))
             
             # Convert tweet dictionaries to Tweet objects
             tweet_objects = create_tweets_from_search_results(tweets)
@@ -384,7 +387,7 @@ David, a major writer of the book of Psalms, explains that you should not put yo
             )
             
         except Exception as e:
-            logger.error(f"Failed to select and respond to tweet: {e}")
+            logger.error("Failed to select and respond to tweet: %s", e)
             # Fallback to keyword filtering if AI fails
             logger.info("Falling back to keyword-based filtering")
             return self._fallback_keyword_selection(tweets)
@@ -448,7 +451,7 @@ David, a major writer of the book of Psalms, explains that you should not put yo
         # Sort by candidate score (highest first)
         candidates.sort(key=lambda x: x.get('candidate_score', 0), reverse=True)
         
-        logger.info(f"Found {len(candidates)} candidates after filtering")
+        logger.info("Found %s candidates after filtering", len(candidates))
         return candidates[:5]  # Limit to top 5 candidates for AI analysis
 
     def _score_tweet_candidacy(self, tweet: Dict) -> int:
@@ -554,14 +557,14 @@ If no tweets are suitable:
                 selected_tweet = next((t for t in tweets if t.id == result['selected_tweet_id']), None)
                 
                 if selected_tweet:
-                    logger.info(f"✅ Step 1: Selected tweet {result['selected_tweet_id']}")
+                    logger.info("✅ Step 1: Selected tweet %s", result['selected_tweet_id'])
                     return selected_tweet
             
-            logger.info(f"❌ Step 1: No suitable tweet found - {result.get('reasoning', 'No reason given')}")
+            logger.info("❌ Step 1: No suitable tweet found - %s", result.get('reasoning', 'No reason given'))
             return None
             
         except Exception as e:
-            logger.error(f"Step 1 failed: {e}")
+            logger.error("Step 1 failed: %s", e)
             return None
 
     def _ai_determine_mood(self, selected_tweet: Tweet) -> Optional[str]:
@@ -619,10 +622,10 @@ If you cannot determine a clear mood, use "sad" as default.
                 
                 # Validate the mood is in our available list
                 if detected_mood not in available_moods:
-                    logger.warning(f"AI returned unknown mood '{detected_mood}', defaulting to 'sad'")
+                    logger.warning("AI returned unknown mood '%s', defaulting to 'sad'", detected_mood)
                     detected_mood = 'sad'
                 
-                logger.info(f"✅ Step 2: Detected mood '{detected_mood}' - {result.get('explanation', '')}")
+                logger.info("✅ Step 2: Detected mood '%s' - %s", detected_mood, result.get('explanation', ''))
                 return detected_mood
                 
             except json.JSONDecodeError:
@@ -630,7 +633,7 @@ If you cannot determine a clear mood, use "sad" as default.
                 return 'sad'
             
         except Exception as e:
-            logger.error(f"Step 2 failed: {e}, defaulting to 'sad'")
+            logger.error("Step 2 failed: %s, defaulting to 'sad'", e)
             return 'sad'
 
     def _ai_generate_response(self, selected_tweet: Tweet, mood: str, bible_verse: Dict) -> Optional[str]:
@@ -681,14 +684,14 @@ EXAMPLES:
             
             # Ensure it fits Twitter's character limit
             if len(generated_response) > 280:
-                logger.warning(f"Response too long ({len(generated_response)} chars), truncating")
+                logger.warning("Response too long (%s chars), truncating", len(generated_response))
                 generated_response = generated_response[:277] + "..."
             
-            logger.info(f"✅ Step 4: Generated response ({len(generated_response)} chars)")
+            logger.info("✅ Step 4: Generated response (%s chars)", len(generated_response))
             return generated_response
             
         except Exception as e:
-            logger.error(f"Step 4 failed: {e}")
+            logger.error("Step 4 failed: %s", e)
             # Fallback response
             return f"🙏 \"{bible_verse['text']}\" - {bible_verse['reference']} ({bible_verse['version']})"
 
@@ -783,18 +786,18 @@ If NO tweets are suitable for a spiritual response, return:
                 selected_tweet = next((t for t in tweets if t['id'] == result['selected_tweet_id']), None)
                 
                 if selected_tweet:
-                    logger.info(f"AI selected tweet {result['selected_tweet_id']}: {result['reasoning']}")
+                    logger.info("AI selected tweet %s: %s", result['selected_tweet_id'], result['reasoning'])
                     return {
                         'selected_tweet': selected_tweet,
                         'response_text': result['response'],
                         'reasoning': result['reasoning']
                     }
             
-            logger.info(f"AI determined no suitable tweets for response: {result.get('reasoning', 'No reason given')}")
+            logger.info("AI determined no suitable tweets for response: %s", result.get('reasoning', 'No reason given'))
             return None
             
         except Exception as e:
-            logger.error(f"Failed in AI filtering and selection: {e}")
+            logger.error("Failed in AI filtering and selection: %s", e)
             return None
 
     def _parse_ai_response_fallback(self, ai_text: str, candidates: List[Dict]) -> Dict:
@@ -829,7 +832,7 @@ If NO tweets are suitable for a spiritual response, return:
             return None
             
         except Exception as e:
-            logger.error(f"Fallback keyword selection failed: {e}")
+            logger.error("Fallback keyword selection failed: %s", e)
             return None
 
     def _fallback_selection_and_response(self, tweet: Dict) -> Dict:
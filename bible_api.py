@@ -14,7 +14,7 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 class BibleAPI:
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.api_key = config.BIBLE_API_KEY
         self.base_url = config.BIBLE_API_URL
         self.headers = {
@@ -22,6 +22,9 @@ class BibleAPI:
             'Accept': 'application/json'
         }
         
+        # Reuse one HTTP session so repeated verse lookups keep their connection
+        self.session = session or requests.Session()
+        
         # Popular Bible versions
         self.bible_versions = {
             'ESV': 'de4e12af7f28f599-02',  # English Standard Version
@@ -267,14 +270,14 @@ class BibleAPI:
             
             # Get chapter content
             url = f"{self.base_url}/bibles/{bible_id}/chapters/{chapter}"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             
             if response.status_code == 200:
                 chapter_data = response.json()
                 
                 # Get verses from the chapter
                 verses_url = f"{self.base_url}/bibles/{bible_id}/chapters/{chapter}/verses"
-                verses_response = requests.get(verses_url, headers=self.headers)
+                verses_response = self.session.get(verses_url, headers=self.headers)
                 
                 if verses_response.status_code == 200:
                     verses_data = verses_response.json()
@@ -287,7 +290,7 @@ class BibleAPI:
                         
                         # Get the full verse content
                         verse_url = f"{self.base_url}/bibles/{bible_id}/verses/{verse_id}"
-                        verse_response = requests.get(verse_url, headers=self.headers)
+                        verse_response = self.session.get(verse_url, headers=self.headers)
                         
                         if verse_response.status_code == 200:
                             verse_data = verse_response.json()
@@ -312,7 +315,7 @@ class BibleAPI:
             bible_id = self.bible_versions.get(version, self.bible_versions['ESV'])
             url = f"{self.base_url}/bibles/{bible_id}/verses/{reference}"
             
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             
             if response.status_code == 200:
                 verse_data = response.json()
@@ -342,7 +345,7 @@ class BibleAPI:
                 'limit': limit
             }
             
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
             
             if response.status_code == 200:
                 search_data = response.json()
@@ -5,25 +5,135 @@ import logging
 from datetime import datetime, date
 from typing import Dict, Optional
 import random
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from twitter_api import TwitterAPI
 from bible_api import BibleAPI, get_fallback_verse
-from ai_responses import AIResponseGenerator
+from ai_responses import AIResponseGenerator, DEFAULT_DAILY_POST_TEXT
 from database import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# SQL for recording daily posts
+_SQL_PG_UPSERT = '''
+    INSERT INTO daily_posts 
+    (date, verse_reference, verse_text, tweet_id, reply_tweet_id, posted_at)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON CONFLICT (date) DO UPDATE SET
+        verse_reference = EXCLUDED.verse_reference,
+        verse_text = EXCLUDED.verse_text,
+        tweet_id = EXCLUDED.tweet_id,
+        reply_tweet_id = EXCLUDED.reply_tweet_id,
+        posted_at = EXCLUDED.posted_at
+'''
+
+_SQL_PG_INSERT = '''
+    INSERT INTO daily_posts 
+    (date, verse_reference, verse_text, tweet_id, reply_tweet_id, posted_at)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON CONFLICT (date) DO NOTHING
+'''
+
+# Simple, clean verse-only formats with optional hashtags, in preference order
+_VERSE_TWEET_TEMPLATES = (
+    '"{text}"\n\n{suffix}',
+    '"{text}"\n\n{suffix}\n\n#BibleVerse #Faith',
+    '"{text}"\n\n- {suffix}',
+)
+
+# (overhead, template) where overhead is the template's fixed length,
+# measured once here so formatting only has to add the verse lengths
+_VERSE_TWEET_OPTIONS = tuple(
+    (len(template.format(text='', suffix='')), template)
+    for template in _VERSE_TWEET_TEMPLATES
+)
+
+_INTROS = (
+    "Good morning! Start your day with this truth:",
+    "Today's encouragement from God's Word:",
+    "Let this verse guide your day:",
+    "God's promise for you today:",
+    "May this verse bless your heart:",
+    "Remember this truth today:",
+    "God's Word for your day:",
+    "Here's some hope for your day:",
+    "Let this encourage you today:",
+    "Today's reminder from Scripture:",
+)
+
+# Theme keywords -> hashtag (every matching theme is added)
+_HASHTAG_THEMES = (
+    (('love', 'beloved', 'heart'), '#Love'),
+    (('peace', 'rest', 'calm'), '#Peace'),
+    (('hope', 'future', 'plans'), '#Hope'),
+    (('strength', 'strong', 'power'), '#Strength'),
+    (('joy', 'rejoice', 'glad'), '#Joy'),
+    (('fear', 'afraid', 'worry'), '#NoFear'),
+    (('prayer', 'pray', 'ask'), '#Prayer'),
+)
+
+_GENERAL_TAGS = ('#Jesus', '#God', '#Christianity', '#Gospel', '#Scripture')
+
+# Theme keywords -> emoji (first matching theme wins)
+_EMOJI_THEMES = (
+    (('love', 'beloved', 'heart'), '💕'),
+    (('peace', 'rest', 'calm'), '☮️'),
+    (('light', 'shine', 'bright'), '✨'),
+    (('strength', 'strong', 'power'), '💪'),
+    (('joy', 'rejoice', 'glad'), '😊'),
+    (('prayer', 'pray', 'ask'), '🙏'),
+    (('crown', 'king', 'throne'), '👑'),
+    (('shepherd', 'sheep', 'flock'), '🐑'),
+)
+
+# Strips punctuation before word-based verse similarity checks
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
 class DailyPoster:
     def __init__(self, dry_run=False):
-        self.twitter_api = TwitterAPI(dry_run=dry_run)
-        self.bible_api = BibleAPI()
+        # One pooled HTTP session for the poster's lifetime, shared by the
+        # Twitter and Bible API clients so connections are reused across calls
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        self.twitter_api = TwitterAPI(dry_run=dry_run, session=self._session)
+        self.bible_api = BibleAPI(session=self._session)
         self.ai_generator = AIResponseGenerator()
         self.db = DatabaseManager()
         self.dry_run = dry_run
         
+        # Number of candidate verses fetched concurrently per daily post
+        self.verse_fetch_attempts = 3
+        
+        # Today's API verse keyed by date: {date: (fetched_at, verse_data)}
+        self._verse_cache = {}
+        self.verse_cache_ttl = 6 * 60 * 60  # 6 hours
+        
+        # AI reflections keyed by (reference, version): {key: (created_at, reflection)}
+        self._reflection_cache = {}
+        self.reflection_cache_ttl = 24 * 60 * 60  # 24 hours
+        
         # Posting approach: verse first, then reply with reflection
         self.use_two_tweet_format = True
         
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the shared HTTP session and release the database pool"""
+        self._session.close()
+        self.db.close()
+        
     def post_daily_verse(self, force=False) -> bool:
         """Post the daily Bible verse"""
         try:
@@ -65,23 +175,34 @@ class DailyPoster:
     def _get_todays_verse(self) -> Optional[Dict]:
         """Get a verse for today's post, avoiding recently used verses"""
         try:
+            # Reuse today's verse for retries and force reposts within the TTL
+            today = date.today()
+            cached = self._verse_cache.get(today)
+            if cached and time.monotonic() - cached[0] < self.verse_cache_ttl:
+                return cached[1]
+            
             # Get recently used verses (last 14 days)
             recently_used_verses = self._get_recently_used_verses(days=14)
             
-            # Try to get verse from API, checking for duplicates
-            max_attempts = 5  # Limit attempts to avoid infinite loops
-            for attempt in range(max_attempts):
-                verse_data = self.bible_api.get_daily_verse()
-                
-                if verse_data:
+            # Fetch a few candidates concurrently and take the first one that
+            # wasn't recently used, instead of retrying one round-trip at a time
+            executor = ThreadPoolExecutor(max_workers=self.verse_fetch_attempts)
+            try:
+                futures = [
+                    executor.submit(self.bible_api.get_daily_verse)
+                    for _ in range(self.verse_fetch_attempts)
+                ]
+                for future in as_completed(futures):
+                    verse_data = future.result()
+                    
                     # Check if this verse was recently used
-                    if not self._is_verse_recently_used(verse_data, recently_used_verses):
+                    if verse_data and not self._is_verse_recently_used(verse_data, recently_used_verses):
+                        # Only cache API results so a failed fetch is retried next time
+                        self._verse_cache = {today: (time.monotonic(), verse_data)}
                         return verse_data
-                    else:
-                        continue
-                else:
-                    # If API fails, break and use fallback
-                    break
+            finally:
+                # Don't wait on the losing requests
+                executor.shutdown(wait=False, cancel_futures=True)
             
             # Fallback to preset verses if API fails or all attempts used
             logger.warning("Bible API failed or all verses were recently used, using fallback verse")
@@ -105,7 +226,7 @@ class DailyPoster:
                 return False
             
             # Generate AI reflection for the reply
-            reflection = self.ai_generator.generate_daily_post_text(verse_data)
+            reflection = self._get_reflection(verse_data)
             
             # Post the reflection as a reply
             reply_tweet_id = self.twitter_api.reply_to_tweet(main_tweet_id, reflection)
@@ -124,32 +245,51 @@ class DailyPoster:
             logger.error(f"Error in two-tweet posting: {e}")
             return False
 
+    def _get_reflection(self, verse_data: Dict) -> str:
+        """Get the AI reflection for a verse, reusing it if the post is retried"""
+        key = (verse_data['reference'], verse_data['version'])
+        now = time.monotonic()
+        
+        cached = self._reflection_cache.get(key)
+        if cached and now - cached[0] < self.reflection_cache_ttl:
+            return cached[1]
+        
+        reflection = self.ai_generator.generate_daily_post_text(verse_data)
+        if reflection == DEFAULT_DAILY_POST_TEXT:
+            # AI call failed; don't pin the generic text for the rest of the day
+            return reflection
+        
+        # Drop expired entries so the cache only holds the last day's verses
+        self._reflection_cache = {
+            k: v for k, v in self._reflection_cache.items()
+            if now - v[0] < self.reflection_cache_ttl
+        }
+        self._reflection_cache[key] = (now, reflection)
+        return reflection
+
     def _format_verse_only_tweet(self, verse_data: Dict) -> str:
         """Format a clean verse-only tweet"""
-        reference = verse_data['reference']
-        text = verse_data['text']
-        version = verse_data['version']
+        reference, text, version = verse_data['reference'], verse_data['text'], verse_data['version']
         
-        # Simple, clean format with optional hashtags
-        tweet_options = [
-            f'"{text}"\n\n{reference} ({version})',
-            f'"{text}"\n\n{reference} ({version})\n\n#BibleVerse #Faith',
-            f'"{text}"\n\n- {reference} ({version})',
-        ]
+        # The reference suffix is shared by every option, so pick the first
+        # option that fits by arithmetic and only build that one string
+        suffix = f'{reference} ({version})'
+        base_len = len(text) + len(suffix)
         
         # Choose the option that fits best
-        for option in tweet_options:
-            if len(option) <= 280:
-                return option
+        for overhead, template in _VERSE_TWEET_OPTIONS:
+            if base_len + overhead <= 280:
+                return template.format(text=text, suffix=suffix)
         
-        # Fallback: truncate verse if needed
-        max_text_length = 280 - len(f'"\n\n{reference} ({version})')
+        # Fallback: truncate verse if needed, using the plainest format
+        overhead, template = _VERSE_TWEET_OPTIONS[0]
+        max_text_length = 280 - len(suffix) - overhead
         if max_text_length > 50:
             truncated_text = text[:max_text_length-3] + "..."
-            return f'"{truncated_text}"\n\n{reference} ({version})'
+            return template.format(text=truncated_text, suffix=suffix)
         
         # Last resort: just reference
-        return f'{reference} ({version})'
+        return suffix
 
     def _format_daily_tweet(self, verse_data: Dict, force_style: str = None) -> str:
         """Format the daily verse tweet with variety"""
@@ -158,48 +298,48 @@ class DailyPoster:
             style = force_style or random.choice(self.posting_styles)
             logger.info(f"Formatting daily tweet with style: {style}")
             
-            reference = verse_data['reference']
             text = verse_data['text']
-            version = verse_data['version']
+            citation = f"{verse_data['reference']} ({verse_data['version']})"
             
             if style == 'verse_only':
                 return self.twitter_api.format_verse_tweet(verse_data)
             
             elif style == 'verse_with_intro':
                 intro = self._get_intro_text()
-                tweet = f"{intro}\n\n\"{text}\"\n\n{reference} ({version})"
+                tweet = f"{intro}\n\n\"{text}\"\n\n{citation}"
                 return self._ensure_tweet_length(tweet)
             
             elif style == 'verse_with_reflection':
-                reflection = self.ai_generator.generate_daily_post_text(verse_data)
+                reflection = self._get_reflection(verse_data)
                 
                 # Try different formatting options based on length
-                option1 = f"{reflection}\n\n\"{text}\"\n\n{reference} ({version})"
+                option1 = f"{reflection}\n\n\"{text}\"\n\n{citation}"
                 if len(option1) <= 280:
                     return option1
                 
                 # If too long, try without quotes around verse
-                option2 = f"{reflection}\n\n{text}\n\n{reference} ({version})"
+                verse_block = f"{text}\n\n{citation}"
+                option2 = f"{reflection}\n\n{verse_block}"
                 if len(option2) <= 280:
                     return option2
                 
                 # If still too long, truncate reflection
-                max_reflection_length = 280 - len(f"\n\n{text}\n\n{reference} ({version})")
+                max_reflection_length = 280 - len(verse_block) - 2
                 if max_reflection_length > 20:
                     truncated_reflection = reflection[:max_reflection_length-3] + "..."
-                    return f"{truncated_reflection}\n\n{text}\n\n{reference} ({version})"
+                    return f"{truncated_reflection}\n\n{verse_block}"
                 
                 # Last resort: just verse with reference
-                return f"{text}\n\n{reference} ({version})"
+                return verse_block
             
             elif style == 'verse_with_hashtags':
                 hashtags = self._get_relevant_hashtags(text)
-                tweet = f"\"{text}\"\n\n{reference} ({version})\n\n{hashtags}"
+                tweet = f"\"{text}\"\n\n{citation}\n\n{hashtags}"
                 return self._ensure_tweet_length(tweet)
             
             elif style == 'verse_with_emojis':
                 emoji = self._get_relevant_emoji(text)
-                tweet = f"{emoji} \"{text}\"\n\n{reference} ({version}) {emoji}"
+                tweet = f"{emoji} \"{text}\"\n\n{citation} {emoji}"
                 return self._ensure_tweet_length(tweet)
             
             # Default fallback
@@ -211,19 +351,7 @@ class DailyPoster:
 
     def _get_intro_text(self) -> str:
         """Get a random intro text for the daily verse"""
-        intros = [
-            "Good morning! Start your day with this truth:",
-            "Today's encouragement from God's Word:",
-            "Let this verse guide your day:",
-            "God's promise for you today:",
-            "May this verse bless your heart:",
-            "Remember this truth today:",
-            "God's Word for your day:",
-            "Here's some hope for your day:",
-            "Let this encourage you today:",
-            "Today's reminder from Scripture:"
-        ]
-        return random.choice(intros)
+        return random.choice(_INTROS)
 
     def _get_relevant_hashtags(self, verse_text: str) -> str:
         """Get relevant hashtags based on verse content"""
@@ -231,25 +359,13 @@ class DailyPoster:
         
         # Determine themes in the verse
         hashtags = ['#BibleVerse', '#Faith']
-        
-        if any(word in text_lower for word in ['love', 'beloved', 'heart']):
-            hashtags.append('#Love')
-        if any(word in text_lower for word in ['peace', 'rest', 'calm']):
-            hashtags.append('#Peace')
-        if any(word in text_lower for word in ['hope', 'future', 'plans']):
-            hashtags.append('#Hope')
-        if any(word in text_lower for word in ['strength', 'strong', 'power']):
-            hashtags.append('#Strength')
-        if any(word in text_lower for word in ['joy', 'rejoice', 'glad']):
-            hashtags.append('#Joy')
-        if any(word in text_lower for word in ['fear', 'afraid', 'worry']):
-            hashtags.append('#NoFear')
-        if any(word in text_lower for word in ['prayer', 'pray', 'ask']):
-            hashtags.append('#Prayer')
+        hashtags.extend(
+            tag for words, tag in _HASHTAG_THEMES
+            if any(word in text_lower for word in words)
+        )
         
         # Add general Christian hashtags
-        general_tags = ['#Jesus', '#God', '#Christianity', '#Gospel', '#Scripture']
-        hashtags.extend(random.sample(general_tags, min(2, len(general_tags))))
+        hashtags.extend(random.sample(_GENERAL_TAGS, 2))
         
         # Limit to avoid overwhelming
         selected_tags = hashtags[:6]
@@ -259,35 +375,18 @@ class DailyPoster:
         """Get relevant emoji based on verse content"""
         text_lower = verse_text.lower()
         
-        if any(word in text_lower for word in ['love', 'beloved', 'heart']):
-            return '💕'
-        elif any(word in text_lower for word in ['peace', 'rest', 'calm']):
-            return '☮️'
-        elif any(word in text_lower for word in ['light', 'shine', 'bright']):
-            return '✨'
-        elif any(word in text_lower for word in ['strength', 'strong', 'power']):
-            return '💪'
-        elif any(word in text_lower for word in ['joy', 'rejoice', 'glad']):
-            return '😊'
-        elif any(word in text_lower for word in ['prayer', 'pray', 'ask']):
-            return '🙏'
-        elif any(word in text_lower for word in ['crown', 'king', 'throne']):
-            return '👑'
-        elif any(word in text_lower for word in ['shepherd', 'sheep', 'flock']):
-            return '🐑'
-        else:
-            return '🙏'  # Default prayer hands
+        for words, emoji in _EMOJI_THEMES:
+            if any(word in text_lower for word in words):
+                return emoji
+        
+        return '🙏'  # Default prayer hands
 
     def _ensure_tweet_length(self, tweet: str) -> str:
         """Ensure tweet fits Twitter's character limit"""
         if len(tweet) <= 280:
             return tweet
         
-        # Try to truncate gracefully
-        if len(tweet) > 280:
-            # Find last complete sentence or phrase
-            truncated = tweet[:277] + "..."
-            return truncated
+        return tweet[:277] + "..."
 
     def _has_posted_today(self, today: date) -> bool:
         """Check if we've already posted today"""
@@ -305,40 +404,10 @@ class DailyPoster:
     def _record_daily_post(self, today: date, verse_data: Dict, tweet_id: str, force=False, reply_id=None):
         """Record today's post in the database"""
         try:
-            if force:
-                # In force mode, update existing record or insert new one
-                if self.db.is_postgres:
-                    self.db.execute_update('''
-                        INSERT INTO daily_posts 
-                        (date, verse_reference, verse_text, tweet_id, reply_tweet_id, posted_at)
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (date) DO UPDATE SET
-                            verse_reference = EXCLUDED.verse_reference,
-                            verse_text = EXCLUDED.verse_text,
-                            tweet_id = EXCLUDED.tweet_id,
-                            reply_tweet_id = EXCLUDED.reply_tweet_id,
-                            posted_at = EXCLUDED.posted_at
-                    ''', (today, verse_data['reference'], verse_data['text'], tweet_id, reply_id, datetime.now()))
-                else:
-                    self.db.execute_update('''
-                        INSERT OR REPLACE INTO daily_posts 
-                        (date, verse_reference, verse_text, tweet_id, reply_tweet_id, posted_at)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (today, verse_data['reference'], verse_data['text'], tweet_id, reply_id, datetime.now()))
-            else:
-                # Normal mode, only insert if not exists
-                if self.db.is_postgres:
-                    self.db.execute_update('''
-                        INSERT INTO daily_posts 
-                        (date, verse_reference, verse_text, tweet_id, reply_tweet_id, posted_at)
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                    ''', (today, verse_data['reference'], verse_data['text'], tweet_id, reply_id, datetime.now()))
-                else:
-                    self.db.execute_update('''
-                        INSERT INTO daily_posts 
-                        (date, verse_reference, verse_text, tweet_id, reply_tweet_id, posted_at)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (today, verse_data['reference'], verse_data['text'], tweet_id, reply_id, datetime.now()))
+            # Force mode upserts; normal mode only inserts if today has no record
+            query = _SQL_PG_UPSERT if force else _SQL_PG_INSERT
+            params = (today, verse_data['reference'], verse_data['text'], tweet_id, reply_id, datetime.now())
+            self.db.execute_update(query, params)
             
         except Exception as e:
             logger.error(f"Error recording daily post: {e}")
@@ -376,22 +445,12 @@ class DailyPoster:
     def _get_recently_used_verses(self, days: int = 14) -> list:
         """Get verses used in the last N days"""
         try:
-            if self.db.is_postgres:
-                query = '''
-                    SELECT verse_reference, verse_text, date
-                    FROM daily_posts 
-                    WHERE date >= CURRENT_DATE - INTERVAL '%s days'
-                    ORDER BY date DESC
-                ''' % days
-            else:
-                query = '''
-                    SELECT verse_reference, verse_text, date
-                    FROM daily_posts 
-                    WHERE date >= date('now', '-%d days')
-                    ORDER BY date DESC
-                ''' % days
-            
-            results = self.db.execute_query(query)
+            results = self.db.execute_query('''
+                SELECT verse_reference, verse_text, date
+                FROM daily_posts 
+                WHERE date >= CURRENT_DATE - make_interval(days => %s)
+                ORDER BY date DESC
+            ''', (days,))
             
             return [
                 {
@@ -433,17 +492,19 @@ class DailyPoster:
         if not text1 or not text2:
             return 0.0
         
-        # Simple word-based similarity
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        # Simple word-based similarity (punctuation stripped so "love," matches "love")
+        words1 = set(text1.lower().translate(_PUNCT_TABLE).split())
+        words2 = set(text2.lower().translate(_PUNCT_TABLE).split())
         
         if not words1 or not words2:
             return 0.0
         
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
+        # Jaccard similarity: |A & B| / |A | B|, with the union size derived
+        # from the intersection instead of building a second set
+        intersection = len(words1 & words2)
+        union = len(words1) + len(words2) - intersection
         
-        return len(intersection) / len(union) if union else 0.0
+        return intersection / union if union else 0.0
 
     def schedule_themed_week(self, theme: str) -> bool:
         """Schedule a week of verses around a specific theme"""
@@ -460,11 +521,13 @@ class DailyPoster:
             
             if theme.lower() in themes:
                 keywords = themes[theme.lower()]
-                # Search for verses matching the theme
-                verses = []
-                for keyword in keywords:
-                    theme_verses = self.bible_api.search_verses(keyword, limit=2)
-                    verses.extend(theme_verses)
+                # Search for verses matching the theme, one request per keyword in parallel
+                with ThreadPoolExecutor(max_workers=len(keywords)) as executor:
+                    results = executor.map(
+                        lambda keyword: self.bible_api.search_verses(keyword, limit=2),
+                        keywords
+                    )
+                    verses = [verse for theme_verses in results for verse in theme_verses]
                 
                 # This could be extended to actually schedule posts
                 logger.info(f"Found {len(verses)} verses for theme '{theme}'")
@@ -3,15 +3,54 @@ Database abstraction layer for PostgreSQL (Railway)
 Requires DATABASE_URL environment variable to be set.
 """
 import os
+import re
+import hashlib
+import itertools
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, List, Any
 from contextlib import contextmanager
+from urllib.parse import urlparse, parse_qs
+
+from psycopg2 import pool
+from psycopg2.extensions import connection as _PgConnection
+from psycopg2.extras import RealDictCursor
 
 logger = logging.getLogger(__name__)
 
+# Matches psycopg2 placeholders (%s) and escaped percent signs (%%)
+_PLACEHOLDER_RE = re.compile(r'%([s%])')
+
+def _to_positional(query: str) -> str:
+    """Rewrite psycopg2 %s placeholders to PREPARE-style $1, $2, ..."""
+    counter = itertools.count(1)
+    return _PLACEHOLDER_RE.sub(
+        lambda m: f'${next(counter)}' if m.group(1) == 's' else '%',
+        query
+    )
+
+class _PreparedConnection(_PgConnection):
+    """psycopg2 connection that carries its own prepared-statement cache
+    
+    Prepared statements live and die with the session, so the cache is kept on the
+    connection object itself; it can't outlive the connection or be picked up by a
+    new connection, however the pool closes or replaces them.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = OrderedDict()  # {statement name: None}, in LRU order
+
 class DatabaseManager:
     """Database manager for PostgreSQL (Railway)"""
     
+    # Connection pools shared by every manager in the process, keyed by connection
+    # params: {key: {'pool': ThreadedConnectionPool, 'slots': BoundedSemaphore, 'users': int}}
+    _shared_pools = {}
+    _shared_pools_lock = threading.Lock()
+    
     def __init__(self, database_url: Optional[str] = None):
         # Require DATABASE_URL to be set - no SQLite fallback
         self.database_url = database_url or os.getenv('DATABASE_URL')
@@ -32,139 +71,180 @@ class DatabaseManager:
                 f"Current value: {self.database_url[:50]}..."
             )
         
+        # Short-lived get_stats result so frequent status polls don't rescan interactions
+        self.stats_cache_ttl = 5.0  # seconds
+        self._stats_cache = (0.0, {})
+        
         self._init_postgres()
     
     def _init_postgres(self):
         """Initialize PostgreSQL connection"""
-        try:
-            import psycopg2
-            
-            # Parse DATABASE_URL for PostgreSQL
-            if self.database_url.startswith('postgresql://'):
-                url = self.database_url[13:]
-            else:
-                url = self.database_url[11:]
-            
-            # Parse the URL components
-            if '@' in url:
-                user_pass, host_db = url.split('@', 1)
-                if ':' in user_pass:
-                    username, password = user_pass.split(':', 1)
-                else:
-                    username, password = user_pass, ''
-                
-                if '/' in host_db:
-                    host_port, database = host_db.split('/', 1)
-                    if ':' in host_port:
-                        host, port = host_port.split(':', 1)
-                    else:
-                        host, port = host_port, '5432'
-                else:
-                    host, port, database = host_port, '5432', 'postgres'
-            else:
-                # Fallback parsing
-                username = os.getenv('DB_USER', 'postgres')
-                password = os.getenv('DB_PASSWORD', '')
-                host = os.getenv('DB_HOST', 'localhost')
-                port = os.getenv('DB_PORT', '5432')
-                database = os.getenv('DB_NAME', 'inchrist_ai')
-            
-            self.connection_params = {
-                'host': host,
-                'port': port,
-                'database': database,
-                'user': username,
-                'password': password
-            }
-            
-            logger.info(f"PostgreSQL connection configured for {host}:{port}/{database}")
-            
-        except ImportError:
-            logger.error("psycopg2 not installed. Install with: pip install psycopg2-binary")
-            raise
-    
-    def _init_sqlite(self):
-        """Initialize SQLite connection"""
-        # Extract file path from sqlite URL
-        if self.database_url.startswith('sqlite:///'):
-            self.db_path = self.database_url[10:]  # Remove 'sqlite:///'
-        else:
-            self.db_path = 'inchrist_ai.db'
+        # Let libpq parse DATABASE_URL itself: it handles percent-encoded
+        # credentials and query options such as ?sslmode=require
+        self.connection_params = {'dsn': self.database_url}
+        
+        url = urlparse(self.database_url)
+        if not url.hostname:
+            # No host in the URL, fall back to individual settings
+            self.connection_params.update({
+                'host': os.getenv('DB_HOST', 'localhost'),
+                'port': os.getenv('DB_PORT', '5432'),
+                'user': os.getenv('DB_USER', 'postgres'),
+                'password': os.getenv('DB_PASSWORD', '')
+            })
+            if not url.path.lstrip('/'):
+                self.connection_params['dbname'] = os.getenv('DB_NAME', 'inchrist_ai')
+        
+        # Detect connections Railway's proxy dropped silently within ~1 minute instead of
+        # waiting out the OS TCP timeout, and bound how long any one query can hang
+        self.connection_params.update({
+            'connect_timeout': 10,
+            'keepalives': 1,
+            'keepalives_idle': 30,
+            'keepalives_interval': 10,
+            'keepalives_count': 3,
+            'options': '-c statement_timeout=10000 -c idle_in_transaction_session_timeout=30000'
+        })
+        
+        # Railway's public proxy hosts need TLS; respect an explicit sslmode in the URL
+        if (url.hostname or '').endswith(('.rlwy.net', '.railway.app')) and 'sslmode' not in parse_qs(url.query):
+            self.connection_params['sslmode'] = 'require'
         
-        logger.info(f"SQLite database path: {self.db_path}")
+        host = self.connection_params.get('host', url.hostname)
+        port = self.connection_params.get('port', url.port or 5432)
+        database = self.connection_params.get('dbname', url.path.lstrip('/') or 'postgres')
+        
+        # DB_STATEMENT_CACHE_SIZE=0 disables server-side prepared statements
+        self.statement_cache_size = int(os.getenv('DB_STATEMENT_CACHE_SIZE', '128'))
+        
+        # Keep warm connections around instead of a new TCP/TLS/auth handshake per query.
+        # DailyPoster and InteractionHandler each create a manager, so they share one pool.
+        # The pool keeps at most min_size idle connections open and closes any other
+        # connection handed back to it, so min_size is sized to the usual concurrency:
+        # the main thread plus InteractionHandler's five mention workers.
+        pool_size = int(os.getenv('DB_POOL_SIZE', '10'))
+        min_size = min(int(os.getenv('DB_POOL_MIN', '6')), pool_size)
+        self._pool_key = tuple(sorted(self.connection_params.items()))
+        with DatabaseManager._shared_pools_lock:
+            shared = DatabaseManager._shared_pools.get(self._pool_key)
+            if shared is None:
+                shared = {
+                    'pool': pool.ThreadedConnectionPool(
+                        minconn=min_size, maxconn=pool_size,
+                        connection_factory=_PreparedConnection, **self.connection_params
+                    ),
+                    # ThreadedConnectionPool raises as soon as it's exhausted; callers wait on
+                    # this for a free connection instead
+                    'slots': threading.BoundedSemaphore(pool_size),
+                    'users': 0
+                }
+                DatabaseManager._shared_pools[self._pool_key] = shared
+                logger.info("PostgreSQL connection configured for %s:%s/%s (pool size %s)", host, port, database, pool_size)
+            shared['users'] += 1
+        
+        self._pool = shared['pool']
+        self._pool_slots = shared['slots']
+        self.pool_timeout = float(os.getenv('DB_POOL_TIMEOUT', '30'))
     
     @contextmanager
-    def get_connection(self):
-        """Get database connection with proper error handling"""
-        if self.is_postgres:
-            import psycopg2
-            from psycopg2.extras import RealDictCursor
-            
-            conn = None
-            try:
-                conn = psycopg2.connect(**self.connection_params)
-                conn.autocommit = False
-                yield conn
+    def get_connection(self, readonly: bool = False):
+        """Get database connection with proper error handling
+        
+        Args:
+            readonly: Run in autocommit mode, skipping the BEGIN/COMMIT round-trips
+                (for plain SELECTs only)
+        """
+        if not self._pool_slots.acquire(timeout=self.pool_timeout):
+            raise pool.PoolError(f"No database connection free after {self.pool_timeout}s")
+        
+        conn = None
+        discard = False
+        try:
+            conn = self._pool.getconn()
+            conn.autocommit = readonly
+            yield conn
+            if not readonly:
                 conn.commit()
-            except Exception as e:
-                if conn:
+        except Exception as e:
+            if conn:
+                try:
                     conn.rollback()
-                logger.error(f"PostgreSQL connection error: {e}")
-                raise
-            finally:
-                if conn:
-                    conn.close()
+                except Exception:
+                    # Connection is unusable, don't hand it back out
+                    discard = True
+            logger.error("PostgreSQL connection error: %s", e)
+            raise
+        finally:
+            if conn:
+                self._pool.putconn(conn, close=discard or bool(conn.closed))
+            self._pool_slots.release()
+    
+    def close(self):
+        """Release this manager's hold on the shared pool, closing it after the last user"""
+        with DatabaseManager._shared_pools_lock:
+            shared = DatabaseManager._shared_pools.get(self._pool_key)
+            if shared is None or shared['pool'] is not self._pool:
+                return
+            shared['users'] -= 1
+            if shared['users'] > 0:
+                return
+            del DatabaseManager._shared_pools[self._pool_key]
+        
+        self._pool.closeall()
+    
+    def _execute(self, conn, cursor, query: str, params: tuple = None):
+        """Execute a statement, reusing a server-side prepared statement when possible
+        
+        Parameterized statements are PREPAREd once per connection and
+        then EXECUTEd, so repeat queries skip parse/plan. Statements without
+        parameters (e.g. DDL) are executed directly.
+        """
+        if not (params and self.statement_cache_size):
+            cursor.execute(query, params or ())
+            return
+        
+        cursor.execute(self._prepared_call(conn, cursor, query, params), params)
+    
+    def _prepared_call(self, conn, cursor, query: str, params: tuple) -> str:
+        """PREPARE query on this connection if needed and return its EXECUTE statement"""
+        statements = conn.prepared
+        name = 'ps_' + hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
+        
+        if name in statements:
+            statements.move_to_end(name)
         else:
-            import sqlite3
-            
-            conn = None
-            try:
-                conn = sqlite3.connect(self.db_path)
-                conn.row_factory = sqlite3.Row  # Enable column access by name
-                yield conn
-                conn.commit()
-            except Exception as e:
-                if conn:
-                    conn.rollback()
-                logger.error(f"SQLite connection error: {e}")
-                raise
-            finally:
-                if conn:
-                    conn.close()
+            cursor.execute(f"PREPARE {name} AS {_to_positional(query)}")
+            statements[name] = None
+            if len(statements) > self.statement_cache_size:
+                evicted, _ = statements.popitem(last=False)
+                cursor.execute(f"DEALLOCATE {evicted}")
+        
+        placeholders = ', '.join(['%s'] * len(params))
+        return f"EXECUTE {name} ({placeholders})"
     
     def execute_query(self, query: str, params: tuple = None) -> List[Dict]:
         """Execute a SELECT query and return results"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            if self.is_postgres:
-                from psycopg2.extras import RealDictCursor
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
-            cursor.execute(query, params or ())
-            
-            if self.is_postgres:
-                return [dict(row) for row in cursor.fetchall()]
-            else:
-                return [dict(row) for row in cursor.fetchall()]
+        with self.get_connection(readonly=True) as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                self._execute(conn, cursor, query, params)
+                
+                # RealDictRow is already a dict subclass, no need to copy each row
+                return cursor.fetchall()
     
     def execute_update(self, query: str, params: tuple = None) -> int:
         """Execute INSERT/UPDATE/DELETE query and return affected rows"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(query, params or ())
+            self._execute(conn, cursor, query, params)
             return cursor.rowcount
     
     def execute_insert(self, query: str, params: tuple = None) -> Any:
         """Execute INSERT query and return the inserted ID"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(query, params or ())
+            self._execute(conn, cursor, query, params)
             
-            if self.is_postgres:
-                return cursor.fetchone()[0] if cursor.description else None
-            else:
-                return cursor.lastrowid
+            return cursor.fetchone()[0] if cursor.description else None
     
     def init_tables(self):
         """Initialize database tables"""
@@ -185,20 +265,6 @@ class DatabaseManager:
             interaction_type TEXT,
             status TEXT DEFAULT 'pending'
         )
-        """ if self.is_postgres else """
-        CREATE TABLE IF NOT EXISTS interactions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            tweet_id TEXT UNIQUE,
-            user_id TEXT,
-            username TEXT,
-            mention_text TEXT,
-            response_text TEXT,
-            response_tweet_id TEXT,
-            created_at TIMESTAMP,
-            responded_at TIMESTAMP,
-            interaction_type TEXT,
-            status TEXT DEFAULT 'pending'
-        )
         """
         
         # Table for tracking daily posts
@@ -212,16 +278,6 @@ class DatabaseManager:
             reply_tweet_id TEXT,
             posted_at TIMESTAMP
         )
-        """ if self.is_postgres else """
-        CREATE TABLE IF NOT EXISTS daily_posts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date DATE UNIQUE,
-            verse_reference TEXT,
-            verse_text TEXT,
-            tweet_id TEXT,
-            reply_tweet_id TEXT,
-            posted_at TIMESTAMP
-        )
         """
         
         # Table for user preferences and history
@@ -236,75 +292,122 @@ class DatabaseManager:
         )
         """
         
-        # Create tables
-        self.execute_update(interactions_table)
-        self.execute_update(daily_posts_table)
-        self.execute_update(users_table)
+        # Small key-value store for bot state that must survive restarts
+        meta_table = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+        """
+        
+        statements = [
+            # Index builds on a large table can outlast the 10s per-query timeout set on
+            # every connection; lift it for this transaction only
+            "SET LOCAL statement_timeout = 0",
+            interactions_table,
+            daily_posts_table,
+            users_table,
+            meta_table,
+            # tweet_id (UNIQUE) and users.user_id (PRIMARY KEY) are already indexed by their
+            # constraints; the extra copies only cost a second index write per upsert
+            "DROP INDEX IF EXISTS idx_interactions_tweet_id",
+            "DROP INDEX IF EXISTS idx_users_user_id",
+            # Create indexes for better performance
+            "CREATE INDEX IF NOT EXISTS idx_interactions_user_id ON interactions(user_id)",
+            "CREATE INDEX IF NOT EXISTS idx_interactions_created_at ON interactions(created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_daily_posts_date ON daily_posts(date DESC)",
+            # Pending rows are a small slice of the table; lets cleanup_old_data use an index scan
+            "CREATE INDEX IF NOT EXISTS idx_interactions_pending ON interactions(created_at) WHERE status = 'pending'",
+            "CREATE INDEX IF NOT EXISTS idx_interactions_status_date ON interactions(status, created_at)",
+            # Completed replies by time, for the hourly response limit check
+            "CREATE INDEX IF NOT EXISTS idx_interactions_hourly ON interactions(responded_at DESC) WHERE status = 'completed'",
+            # interactions takes an upsert per mention plus the pending-row
+            # cleanup; vacuum/analyze it well before the 20% dead-tuple default
+            "ALTER TABLE interactions SET (autovacuum_vacuum_scale_factor = 0.05, autovacuum_analyze_scale_factor = 0.02)",
+        ]
         
-        # Create indexes for better performance
-        if self.is_postgres:
-            self.execute_update("CREATE INDEX IF NOT EXISTS idx_interactions_tweet_id ON interactions(tweet_id)")
-            self.execute_update("CREATE INDEX IF NOT EXISTS idx_interactions_user_id ON interactions(user_id)")
-            self.execute_update("CREATE INDEX IF NOT EXISTS idx_interactions_created_at ON interactions(created_at)")
-            self.execute_update("CREATE INDEX IF NOT EXISTS idx_users_user_id ON users(user_id)")
+        # Create everything in one round-trip and one transaction
+        with self.get_connection() as conn:
+            conn.cursor().execute(";\n".join(statements))
         
         logger.info("Database tables initialized successfully")
     
+    def get_meta(self, key: str) -> Optional[str]:
+        """Get a value from the meta table, or None if it isn't set"""
+        rows = self.execute_query("SELECT value FROM meta WHERE key = %s", (key,))
+        return rows[0]['value'] if rows else None
+    
+    def set_meta(self, key: str, value: str):
+        """Set a value in the meta table"""
+        self.execute_update(
+            "INSERT INTO meta (key, value) VALUES (%s, %s) ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value",
+            (key, value)
+        )
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
+        now = time.monotonic()
+        cached_at, cached_stats = self._stats_cache
+        # Hand out copies, so a caller changing its dict can't change the cache
+        if cached_stats and now - cached_at < self.stats_cache_ttl:
+            return dict(cached_stats)
+        
         try:
-            # Total interactions
-            total_interactions = self.execute_query("SELECT COUNT(*) as count FROM interactions")[0]['count']
-            
-            # Successful responses
-            successful_responses = self.execute_query(
-                "SELECT COUNT(*) as count FROM interactions WHERE status = 'completed'"
-            )[0]['count']
+            # All counts in one pass over interactions (one round-trip instead of four)
+            row = self.execute_query("""
+                SELECT
+                    COUNT(*) AS total,
+                    COUNT(*) FILTER (WHERE status = 'completed') AS completed,
+                    COUNT(*) FILTER (WHERE created_at >= CURRENT_DATE AND created_at < CURRENT_DATE + 1) AS today,
+                    COUNT(DISTINCT user_id) AS unique_users
+                FROM interactions
+            """)[0]
             
-            # Today's activity
-            if self.is_postgres:
-                today_activity = self.execute_query(
-                    "SELECT COUNT(*) as count FROM interactions WHERE DATE(created_at) = CURRENT_DATE"
-                )[0]['count']
-            else:
-                today_activity = self.execute_query(
-                    "SELECT COUNT(*) as count FROM interactions WHERE DATE(created_at) = DATE('now')"
-                )[0]['count']
+            total_interactions = row['total']
+            successful_responses = row['completed']
+            today_activity = row['today']
+            unique_users = row['unique_users']
             
-            # Unique users
-            unique_users = self.execute_query("SELECT COUNT(DISTINCT user_id) as count FROM interactions")[0]['count']
-            
-            return {
+            stats = {
                 'total_interactions': total_interactions,
                 'successful_responses': successful_responses,
                 'today_interactions': today_activity,
                 'unique_users': unique_users,
                 'response_rate': (successful_responses / total_interactions * 100) if total_interactions > 0 else 0
             }
+            self._stats_cache = (now, dict(stats))
+            return stats
             
         except Exception as e:
-            logger.error(f"Error getting database stats: {e}")
+            logger.error("Error getting database stats: %s", e)
             return {}
     
-    def cleanup_old_data(self, days: int = 30) -> int:
+    def cleanup_old_data(self, days: int = 30, batch_size: int = 1000) -> int:
         """Clean up old interaction data
         
         Only deletes old PENDING interactions (never responded to).
         Keeps all completed/failed interactions to prevent duplicate responses.
+        Deletes in batches of batch_size rows, each in its own transaction, so a large
+        backlog doesn't hold row locks or one long transaction for the whole scan.
         """
+        deleted_count = 0
         try:
-            if self.is_postgres:
-                # Only delete old pending interactions (never responded to)
-                # Keep all completed/failed interactions to prevent duplicate responses
-                deleted_count = self.execute_update(
-                    "DELETE FROM interactions WHERE created_at < NOW() - INTERVAL '%s days' AND status = 'pending'" % days
-                )
-            else:
-                deleted_count = self.execute_update(
-                    "DELETE FROM interactions WHERE created_at < datetime('now', '-%d days') AND status = 'pending'" % days
-                )
-            logger.info(f"Cleaned up {deleted_count} old pending interactions (kept all completed/failed interactions)")
+            # Only delete old pending interactions (never responded to)
+            # Keep all completed/failed interactions to prevent duplicate responses
+            while True:
+                deleted = self.execute_update("""
+                    DELETE FROM interactions WHERE id IN (
+                        SELECT id FROM interactions
+                        WHERE created_at < NOW() - make_interval(days => %s) AND status = 'pending'
+                        LIMIT %s
+                    )
+                """, (days, batch_size))
+                deleted_count += deleted
+                if deleted < batch_size:
+                    break
+            logger.info("Cleaned up %s old pending interactions (kept all completed/failed interactions)", deleted_count)
             return deleted_count
         except Exception as e:
-            logger.error(f"Error cleaning up old data: {e}")
-            return 0
+            # Batches already committed stay deleted
+            logger.error("Error cleaning up old data after %s rows: %s", deleted_count, e)
+            return deleted_count
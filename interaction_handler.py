@@ -2,42 +2,244 @@
 Handles Twitter interactions, mentions, and responses
 """
 import logging
+import re
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import Counter, OrderedDict, deque
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from twitter_api import TwitterAPI
 from ai_responses import AIResponseGenerator
-from bible_api import BibleAPI
 from database import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# SQL issued per mention or per batch. Kept as module constants so every call sends the
+# identical text and reuses the same prepared statement in DatabaseManager's cache.
+
+# A tweet is handled once a reply was posted, or a previous attempt failed / chose not to
+# reply; same rules as _has_responded_to_tweet
+_SQL_HANDLED = "((response_tweet_id IS NOT NULL AND TRIM(response_tweet_id) <> '') OR status IN ('failed', 'no_reply'))"
+
+_SQL_TWEET_STATUS = 'SELECT response_tweet_id, status FROM interactions WHERE tweet_id = %s'
+
+_SQL_TWEET_HANDLED = f'SELECT {_SQL_HANDLED} AS responded FROM interactions WHERE tweet_id = %s'
+
+_SQL_HANDLED_AMONG = f'SELECT tweet_id FROM interactions WHERE tweet_id = ANY(%s) AND {_SQL_HANDLED}'
+
+_SQL_RECENT_HANDLED = f'SELECT tweet_id FROM interactions WHERE {_SQL_HANDLED} ORDER BY id DESC LIMIT %s'
+
+# Upserts the interaction and bumps its user in one statement
+_SQL_RECORD_INTERACTION = '''
+    WITH ins AS (
+        INSERT INTO interactions 
+        (tweet_id, user_id, username, mention_text, response_text, response_tweet_id, 
+         created_at, responded_at, interaction_type, status)
+        VALUES (%s, %s, %s, %s, %s, %s, %s::timestamptz, %s, %s, %s)
+        ON CONFLICT (tweet_id) DO UPDATE SET
+            user_id = EXCLUDED.user_id,
+            username = COALESCE(EXCLUDED.username, interactions.username),
+            mention_text = EXCLUDED.mention_text,
+            response_text = EXCLUDED.response_text,
+            response_tweet_id = EXCLUDED.response_tweet_id,
+            responded_at = EXCLUDED.responded_at,
+            interaction_type = EXCLUDED.interaction_type,
+            status = EXCLUDED.status
+        RETURNING user_id, username
+    )
+    INSERT INTO users 
+    (user_id, username, last_interaction, interaction_count)
+    SELECT user_id, username, %s::timestamp, 1 FROM ins
+    ON CONFLICT (user_id) DO UPDATE SET
+        username = COALESCE(EXCLUDED.username, users.username),
+        last_interaction = EXCLUDED.last_interaction,
+        interaction_count = users.interaction_count + 1
+'''
+
+# Openly hostile mentions the AI would answer with NO_REPLY anyway; matching them locally
+# saves the OpenAI round-trip. Only a tweet that is nothing but one of these phrases (after
+# dropping @handles and punctuation) counts, so "my dad told me to fuck off, I need prayer"
+# still goes to the AI. Self-harm phrases are never shortcut - they may be someone in crisis.
+_NO_REPLY_RE = re.compile(
+    r"(?:f+u+c*k+\s+(?:you|u|off)|stfu|shut\s+the\s+f+u*c*k+\s+up|screw\s+you|piss\s+off)",
+    re.IGNORECASE
+)
+
+# Dropped before matching _NO_REPLY_RE: @handles anywhere, then leading/trailing punctuation
+_HANDLE_RE = re.compile(r"@\w+")
+_NO_REPLY_STRIP = " \t\r\n.,!?:;-*"
+
+# Context given to the AI for every mention; extended when the mention replies to a tweet
+_BASE_CONTEXT = "Someone on Twitter is asking for spiritual guidance"
+
+def _compile_blocked_words(words: List[str]) -> Optional[re.Pattern]:
+    """Build one case-insensitive pattern matching any of words, or None to block nothing
+    
+    Each word matches whole or with a common inflection ("bots", "scammers",
+    "spamming"), but not inside other words ("both", "bother", "robot").
+    """
+    if not words:
+        return None
+    return re.compile(
+        r'\b(?:' + '|'.join(map(re.escape, words)) + r')(?:s|es|mers?|ming|med)?\b', re.IGNORECASE
+    )
+
+def _as_local_datetime(value) -> Optional[datetime]:
+    """Normalize a stored timestamp to a naive local datetime, comparable with datetime.now()
+    
+    psycopg2 returns TIMESTAMP columns as naive datetimes, which pass through as-is.
+    ISO strings and timezone-aware values (e.g. a TIMESTAMPTZ column) are converted.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter; acquire() blocks until a token is free"""
+    
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Take the token now (possibly going negative) so waiters are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+
+class RollingCounter:
+    """Thread-safe per-key event counts over a rolling window
+    
+    Kept as a ring of fixed-width Counter buckets; buckets that fall out of the
+    window are dropped lazily on the next hit.
+    """
+    
+    def __init__(self, window: float = 3600, buckets: int = 60):
+        self.bucket_width = window / buckets
+        self._buckets: deque = deque([Counter()], maxlen=buckets)
+        self._current = int(time.monotonic() // self.bucket_width)
+        self._lock = threading.Lock()
+    
+    def hit(self, key: str) -> int:
+        """Count one event for key and return its total over the window"""
+        with self._lock:
+            self._advance()
+            self._buckets[-1][key] += 1
+            return sum(bucket[key] for bucket in self._buckets)
+    
+    def count(self, key: str) -> int:
+        """Return key's total over the window without counting an event"""
+        with self._lock:
+            self._advance()
+            return sum(bucket[key] for bucket in self._buckets)
+    
+    def _advance(self):
+        """Start fresh buckets for the time passed since the last call (lock held)"""
+        now = int(time.monotonic() // self.bucket_width)
+        for _ in range(min(now - self._current, self._buckets.maxlen)):
+            self._buckets.append(Counter())
+        self._current = now
+
 class InteractionHandler:
     def __init__(self, dry_run=False):
         self.twitter_api = TwitterAPI(dry_run=dry_run)
-        self.ai_generator = AIResponseGenerator()
-        self.bible_api = BibleAPI()
+        # Our own account ID, from config; lets self-mentions be skipped without an API call
+        self._bot_user_id = str(self.twitter_api.user_id)
+        # AI client is created on first use (see ai_generator), so runs that only read stats
+        # or clean up don't pay for it
+        self._ai_generator: Optional[AIResponseGenerator] = None
+        self._ai_generator_lock = threading.Lock()
         self.dry_run = dry_run
         
         # Initialize database manager (PostgreSQL on Railway)
         self.db = DatabaseManager()
         self.db.init_tables()
         
+        # Newest mention seen, persisted so a restart doesn't re-fetch handled mentions
+        self.last_mention_id = self._load_last_mention_id()
+        
         # Rate limiting and spam prevention
-        self.last_mention_id = None
         self.response_cooldown = 60  # Minimum seconds between responses to same user
         self.max_responses_per_hour = 30
         self.blocked_words = ['spam', 'bot', 'fake', 'scam']
+        # Users who mention us in bursts are skipped once they pass this many in an hour
+        self.max_mentions_per_user_per_hour = 10
+        self._mention_frequency = RollingCounter(window=3600, buckets=60)
+        # Mention IDs already counted above, so a deferred mention fetched again on the
+        # next run isn't counted twice. Kept as a bounded LRU: {tweet_id: None}
+        self._counted_mentions: OrderedDict = OrderedDict()
+        self.counted_mentions_size = 4096
+        # AI generation overlaps across mentions; posting replies is one at a time
+        self.mention_workers = 5  # Mentions processed concurrently
+        self._post_limiter = TokenBucket(rate=0.5, capacity=1)  # At most one reply every 2s
+        self._post_lock = threading.Lock()
+        
+        # Monotonic times of completed replies in the last hour (sliding window). Seeded from
+        # the database once at startup, then kept in-process so the hourly limit needs no queries.
+        self._recent_replies: deque = deque()
+        self._recent_replies_lock = threading.Lock()
+        self._load_recent_replies()
+        
+        # Last interaction per user, seeded at startup with users still inside their cooldown
+        # and kept current by _record_interaction; a miss means the user isn't rate limited.
+        # Kept as a bounded LRU of epoch seconds: {user_id: float}
+        self._user_last_interaction: OrderedDict = OrderedDict()
+        self.user_cache_size = 1024
+        self._user_lock = threading.Lock()
+        self._load_recent_users()
+        
+        # Tweet IDs known to be handled (replied, failed or no_reply). Those states are final,
+        # so a hit never needs to go back to the database. Seeded with the most recently
+        # handled tweets, the ones a fresh mentions fetch is most likely to return.
+        # Kept as a bounded LRU: {tweet_id: None}
+        self._responded_cache: OrderedDict = OrderedDict()
+        self.responded_cache_size = 4096
+        self._responded_lock = threading.Lock()
+        self._load_responded()
         
+    def close(self):
+        """Release the database pool"""
+        self.db.close()
+
+    @property
+    def ai_generator(self) -> AIResponseGenerator:
+        # Mention workers can race to the first use; build the client once
+        if self._ai_generator is None:
+            with self._ai_generator_lock:
+                if self._ai_generator is None:
+                    self._ai_generator = AIResponseGenerator()
+        return self._ai_generator
+
+    @property
+    def blocked_words(self) -> List[str]:
+        return self._blocked_words
+
+    @blocked_words.setter
+    def blocked_words(self, words: List[str]):
+        # Recompiled on assignment so the pattern can't go stale
+        self._blocked_words = list(words)
+        self._blocked_re = _compile_blocked_words(self._blocked_words)
 
     def process_mentions(self) -> int:
         """Process new mentions and generate responses"""
         try:
             # Get recent mentions - maximize data retrieval for our precious daily API call
             # Use max count and get all mentions since last check (X API Free tier: 100 calls/month)
-            all_mentions = self.twitter_api.get_mentions(since_id=None, count=25)
+            all_mentions = self.twitter_api.get_mentions(since_id=self.last_mention_id, count=100)
             
             if not all_mentions:
                 logger.info("No mentions found in recent history")
@@ -45,146 +247,300 @@ class InteractionHandler:
             
             
             # Log all mentions found for visibility
-            logger.info(f"Found {len(all_mentions)} mentions in recent history:")
-            for i, mention in enumerate(all_mentions, 1):
-                status = "NEW" if not self.last_mention_id or mention['id'] > self.last_mention_id else "OLD"
-                logger.info(f"  {i}. [{status}] {mention['text'][:50]}... (ID: {mention['id']}, Author: {mention['author_id']})")
-            
-            # Filter to only unprocessed mentions (check database for each)
-            unprocessed_mentions = []
-            for mention in all_mentions:
-                if not self._has_responded_to_tweet(mention['id']):
-                    unprocessed_mentions.append(mention)
-                else:
-                    logger.debug(f"Skipping already processed mention: {mention['id']}")
-            
-            if not unprocessed_mentions:
-                logger.info("No unprocessed mentions found (all have been responded to)")
+            logger.info("Found %s mentions in recent history", len(all_mentions))
+            # Per-mention listing is debug detail; the count above is enough at INFO
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, mention in enumerate(all_mentions, 1):
+                    status = "NEW" if not self.last_mention_id or int(mention['id']) > int(self.last_mention_id) else "OLD"
+                    logger.debug("  %s. [%s] %s... (ID: %s, Author: %s)", i, status, mention['text'][:50], mention['id'], mention['author_id'])
+            
+            # Apply every filter in cost order; only mentions that pass the in-process checks
+            # reach the database lookups
+            batch, deferred = self._filter_mentions(all_mentions)
+            
+            # Mentions without a recorded outcome are left for a later run, like deferred ones
+            unfinished = list(deferred)
+            
+            if not batch:
+                logger.info("Processed 0 mentions")
+                self._advance_last_mention_id(self._handled_mark(all_mentions, unfinished))
                 return 0
             
-            logger.info(f"Processing {len(unprocessed_mentions)} unprocessed mentions...")
+            # Overlap the AI and Twitter calls of a few mentions instead of handling them in series.
+            # A lone mention (the usual case with since_id) runs inline without a thread pool.
             processed_count = 0
-            
-            for mention in unprocessed_mentions:
-                try:
-                    # Update last mention ID
-                    if not self.last_mention_id or mention['id'] > self.last_mention_id:
-                        self.last_mention_id = mention['id']
-                    
-                    # Check if we should respond to this mention
-                    if self._should_respond_to_mention(mention):
-                        success = self._process_single_mention(mention)
+            if len(batch) == 1:
+                success, final = self._handle_mention(batch[0])
+                processed_count = int(success)
+                if not final:
+                    unfinished.append(batch[0])
+            else:
+                with ThreadPoolExecutor(max_workers=min(self.mention_workers, len(batch))) as executor:
+                    futures = {executor.submit(self._handle_mention, mention): mention for mention in batch}
+                    for future in as_completed(futures):
+                        try:
+                            success, final = future.result()
+                        except Exception as e:
+                            logger.error("Error processing mention %s: %s", futures[future]['id'], e)
+                            success, final = False, False
                         if success:
                             processed_count += 1
-                    
-                    # Rate limiting - small delay between processing mentions
-                    time.sleep(2)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing mention {mention['id']}: {e}")
-                    continue
+                        if not final:
+                            unfinished.append(futures[future])
             
-            logger.info(f"Processed {processed_count} mentions")
+            logger.info("Processed %s mentions", processed_count)
+            self._advance_last_mention_id(self._handled_mark(all_mentions, unfinished))
             return processed_count
             
         except Exception as e:
-            logger.error(f"Failed to process mentions: {e}")
+            logger.error("Failed to process mentions: %s", e)
             return 0
 
-    def _should_respond_to_mention(self, mention: Dict) -> bool:
-        """Determine if we should respond to a mention"""
+    def _load_last_mention_id(self) -> Optional[str]:
+        """Load the persisted newest mention ID, or None to fetch recent history"""
+        try:
+            return self.db.get_meta('last_mention_id')
+        except Exception as e:
+            logger.warning("Could not load last mention ID: %s", e)
+            return None
+
+    def _advance_last_mention_id(self, mention_id: Optional[str]):
+        """Move the since_id high-water mark forward and persist it"""
+        if not mention_id or (self.last_mention_id and int(mention_id) <= int(self.last_mention_id)):
+            return
+        self.last_mention_id = mention_id
+        try:
+            self.db.set_meta('last_mention_id', mention_id)
+        except Exception as e:
+            # Worst case the next run re-fetches mentions the DB already filters out
+            logger.warning("Could not persist last mention ID: %s", e)
+
+    def _handled_mark(self, mentions: List[Dict], unfinished: List[Dict]) -> Optional[str]:
+        """Newest mention ID that since_id can move to without skipping an unfinished mention
+        
+        Tweet IDs are compared as numbers, since string comparison misorders IDs of
+        different lengths.
+        """
+        ids = [m['id'] for m in mentions]
+        if unfinished:
+            oldest_unfinished = min(int(m['id']) for m in unfinished)
+            ids = [tid for tid in ids if int(tid) < oldest_unfinished]
+        return max(ids, key=int) if ids else None
+
+    def _filter_mentions(self, mentions: List[Dict], unresponded_ids: Optional[Set[str]] = None) -> Tuple[List[Dict], List[Dict]]:
+        """Select the mentions to respond to, cheapest checks first
+        
+        Runs the self/blocked-word checks, then the already-responded check, then the
+        per-user mention frequency, cooldown and hourly limits. The batch lookup is only made for mentions that
+        survive the in-process checks, unless its result is passed in; the limits are
+        answered in-process.
+        
+        Returns:
+            (mentions to respond to, mentions left for a later run by the cooldown or
+            hourly limits)
+        """
+        candidates = [m for m in mentions if not self._is_ignored_mention(m)]
+        
+        # One database query for the whole batch
+        if unresponded_ids is None:
+            unresponded_ids = self._filter_unresponded([str(m['id']).strip() for m in candidates])
+        unprocessed = []
+        for mention in candidates:
+            if str(mention['id']).strip() in unresponded_ids:
+                unprocessed.append(mention)
+            else:
+                logger.debug("Skipping already processed mention: %s", mention['id'])
+        
+        if not unprocessed:
+            logger.info("No unprocessed mentions found (all have been responded to)")
+            return [], []
+        
+        logger.info("Processing %s unprocessed mentions...", len(unprocessed))
+        
+        batch = []
+        deferred = []
+        batch_authors = set()
+        for i, mention in enumerate(unprocessed):
+            # Every new mention counts towards its author's rolling hour, answered or not.
+            # Skipped mentions are recorded as no_reply so since_id can move past them.
+            if self._count_mention(mention) > self.max_mentions_per_user_per_hour:
+                logger.info("User is mentioning too often, skipping: %s", mention['author_id'])
+                if not self._record_mention(mention, "NO_REPLY", None, 'no_reply', datetime.now()):
+                    deferred.append(mention)
+                continue
+            
+            # A second mention from someone we're answering in this batch falls inside
+            # their per-user cooldown
+            if mention['author_id'] in batch_authors:
+                logger.info("User is rate limited: %s", mention['author_id'])
+                deferred.append(mention)
+                continue
+            
+            signals = self._gating_signals(mention['id'], mention['author_id'], False)
+            if signals['last_interaction'] is not None:
+                logger.info("User is rate limited: %s", mention['author_id'])
+                deferred.append(mention)
+                continue
+            
+            # Replies in this batch haven't been counted yet, so reserve them against the
+            # hourly limit as we go
+            if signals['hourly_count'] + len(batch) >= self.max_responses_per_hour:
+                logger.info("Hourly response limit reached")
+                return batch, deferred + unprocessed[i:]
+            
+            batch_authors.add(mention['author_id'])
+            batch.append(mention)
+        
+        return batch, deferred
+
+    def _count_mention(self, mention: Dict) -> int:
+        """Count a mention towards its author's rolling hour, once per tweet ID"""
+        tweet_id = str(mention['id']).strip()
+        if tweet_id in self._counted_mentions:
+            self._counted_mentions.move_to_end(tweet_id)
+            return self._mention_frequency.count(mention['author_id'])
+        
+        self._counted_mentions[tweet_id] = None
+        if len(self._counted_mentions) > self.counted_mentions_size:
+            self._counted_mentions.popitem(last=False)
+        return self._mention_frequency.hit(mention['author_id'])
+
+    def _is_ignored_mention(self, mention: Dict) -> bool:
+        """In-process checks that rule a mention out without touching the database"""
+        # Don't respond to our own tweets (check using our known user ID)
+        if mention['author_id'] == self._bot_user_id:
+            logger.info("Skipping mention from ourselves: %s", mention['id'])
+            return True
+        
+        # Check for blocked words
+        if self._blocked_re and self._blocked_re.search(mention['text']):
+            logger.info("Blocked mention due to spam words: %s", mention['id'])
+            return True
+        
+        return False
+
+    def _should_respond_to_mention(self, mention: Dict, unresponded_ids: Optional[Set[str]] = None) -> bool:
+        """Determine if we should respond to a mention
+        
+        Args:
+            mention: The mention to check
+            unresponded_ids: Result of _filter_unresponded for the current batch, if
+                already known; skips re-checking the database for this mention
+        """
         try:
-            # Don't respond to our own tweets (check using our known user ID)
-            if mention['author_id'] == self.twitter_api.user_id:
-                logger.info(f"Skipping mention from ourselves: {mention['id']}")
+            # Self-mentions and blocked words, before any database checks
+            if self._is_ignored_mention(mention):
                 return False
             
-            # Check if already responded
-            if self._has_responded_to_tweet(mention['id']):
-                logger.info(f"Already responded to tweet: {mention['id']}")
-                return False
+            # Database-backed checks, fetched together
+            responded = None
+            if unresponded_ids is not None:
+                responded = str(mention['id']).strip() not in unresponded_ids
+            signals = self._gating_signals(mention['id'], mention['author_id'], responded)
             
-            # Check for blocked words
-            mention_text = mention['text'].lower()
-            if any(word in mention_text for word in self.blocked_words):
-                logger.info(f"Blocked mention due to spam words: {mention['id']}")
+            # Check if already responded
+            if signals['responded']:
+                logger.info("Already responded to tweet: %s", mention['id'])
                 return False
             
             # Check user rate limiting
-            if self._is_user_rate_limited(mention['author_id']):
-                logger.info(f"User is rate limited: {mention['author_id']}")
+            if signals['last_interaction'] is not None:
+                logger.info("User is rate limited: %s", mention['author_id'])
                 return False
             
             # Check hourly response limit
-            if self._hourly_response_limit_reached():
-                logger.info(f"Hourly response limit reached")
+            if signals['hourly_count'] >= self.max_responses_per_hour:
+                logger.warning("Hourly response limit reached: %s/%s", signals['hourly_count'], self.max_responses_per_hour)
                 return False
             
             return True
             
         except Exception as e:
-            logger.error(f"Error checking if should respond to mention: {e}")
+            logger.error("Error checking if should respond to mention: %s", e)
             return False
 
+    def _mention_user_info(self, mention: Dict) -> Dict:
+        """Create minimal user info from mention data (no API call needed)"""
+        return {
+            'id': mention['author_id'],
+            # From the mentions call's author expansion; generic if it wasn't included
+            'username': mention.get('author_username') or 'TwitterUser',
+            'name': 'Twitter User'
+        }
+
     def _process_single_mention(self, mention: Dict) -> bool:
         """Process a single mention and generate response"""
+        return self._handle_mention(mention)[0]
+
+    def _handle_mention(self, mention: Dict) -> Tuple[bool, bool]:
+        """Process a single mention
+        
+        Returns:
+            (whether it was handled successfully, whether it reached a final state -
+            recorded, or a reply posted - so since_id may move past it)
+        """
         try:
-            # Create minimal user info from mention data (no API call needed)
-            user_info = {
-                'id': mention['author_id'],
-                'username': 'TwitterUser',  # Generic, since we don't need real username for replies
-                'name': 'Twitter User'
-            }
-            
-            # Store interaction in database
-            self._store_interaction(mention, user_info)
-            
-            # Get original tweet context if this mention is a reply
-            context = self._get_mention_context(mention)
-            
-            # Generate AI response (no username needed - Twitter handles reply tagging automatically)
-            response_text = self.ai_generator.generate_response(
-                mention_text=mention['text'],
-                user_info=user_info,
-                context=context
-            )
+            if self._fast_no_reply(mention['text']):
+                # Obvious attack: skip the AI call, the answer would be NO_REPLY
+                response_text = "NO_REPLY"
+            else:
+                user_info = self._mention_user_info(mention)
+                
+                # Get original tweet context if this mention is a reply
+                context = self._get_mention_context(mention)
+                
+                # Generate AI response (no username needed - Twitter handles reply tagging automatically)
+                response_text = self.ai_generator.generate_response(
+                    mention_text=mention['text'],
+                    user_info=user_info,
+                    context=context
+                )
             
             if not response_text:
-                logger.error(f"Failed to generate response for mention {mention['id']}")
-                return False
+                logger.error("Failed to generate response for mention %s", mention['id'])
+                return False, False
+            
+            # One timestamp for every write about this mention from here on
+            now = datetime.now()
             
             # Check if AI decided not to reply
             if response_text.strip().upper() == "NO_REPLY":
-                logger.info(f"AI decided not to reply to mention {mention['id']} (combative/inappropriate content)")
+                logger.info("Decided not to reply to mention %s (combative/inappropriate content)", mention['id'])
                 # Still record the interaction but mark as "no response needed"
-                self._update_interaction_response(mention['id'], "NO_REPLY", None, status='no_reply')
-                return True  # This is successful - we appropriately chose not to respond
+                recorded = self._record_mention(mention, "NO_REPLY", None, 'no_reply', now)
+                return True, recorded  # This is successful - we appropriately chose not to respond
             
-            # Post reply
-            reply_tweet_id = self.twitter_api.reply_to_tweet(mention['id'], response_text)
+            # Post reply (paced here, so skipped and NO_REPLY mentions don't wait)
+            with self._post_lock:
+                self._post_limiter.acquire()
+                reply_tweet_id = self.twitter_api.reply_to_tweet(mention['id'], response_text)
             
             if reply_tweet_id:
-                # Update database with response
-                self._update_interaction_response(mention['id'], response_text, reply_tweet_id)
-                logger.info(f"Successfully responded to mention {mention['id']}")
-                return True
+                # Record the mention and our reply in one write
+                self._record_mention(mention, response_text, reply_tweet_id, 'completed', now)
+                logger.info("Successfully responded to mention %s", mention['id'])
+                # The reply is out, so it's final even if the write failed
+                return True, True
             else:
-                logger.error(f"Failed to post reply to mention {mention['id']}")
+                logger.error("Failed to post reply to mention %s", mention['id'])
                 # CRITICAL: Update database even on failure to prevent retry loops
                 # Mark as 'failed' status so we know we attempted but don't retry
-                self._update_interaction_response(mention['id'], response_text, None, status='failed')
-                logger.warning(f"⚠️  Marked mention {mention['id']} as 'failed' in database to prevent retry")
-                return False
+                recorded = self._record_mention(mention, response_text, None, 'failed', now)
+                logger.warning("⚠️  Marked mention %s as 'failed' in database to prevent retry", mention['id'])
+                return False, recorded
             
         except Exception as e:
-            logger.error(f"Error processing single mention: {e}")
-            return False
+            logger.error("Error processing single mention: %s", e)
+            return False, False
+
+    def _fast_no_reply(self, text: str) -> bool:
+        """Check if a mention is only an insult aimed at the bot, without asking the AI"""
+        remainder = _HANDLE_RE.sub(" ", text).strip(_NO_REPLY_STRIP)
+        return _NO_REPLY_RE.fullmatch(remainder) is not None
 
     def _get_mention_context(self, mention: Dict) -> str:
         """Get context for a mention, including original tweet if it's a reply"""
         try:
-            base_context = "Someone on Twitter is asking for spiritual guidance"
-            
             # Check if this mention has original tweet data (already fetched in the same API call)
             original_tweet = mention.get('original_tweet')
             if original_tweet:
@@ -195,11 +551,11 @@ class InteractionHandler:
                     if len(original_text) > max_context_length:
                         original_text = original_text[:max_context_length] + "..."
                     
-                    context_with_original = f"{base_context}. They are replying to this original tweet: \"{original_text}\""
-                    logger.info(f"Added original tweet context from mention data: {original_text[:50]}...")
+                    context_with_original = f"{_BASE_CONTEXT}. They are replying to this original tweet: \"{original_text}\""
+                    logger.info("Added original tweet context from mention data: %s...", original_text[:50])
                     return context_with_original
                 else:
-                    logger.warning(f"Original tweet found but has no text")
+                    logger.warning("Original tweet found but has no text")
             else:
                 # Check if this is a reply but we didn't get the original tweet in the API response
                 conversation_id = mention.get('conversation_id')
@@ -207,100 +563,39 @@ class InteractionHandler:
                 
                 # Log reply status - no additional API calls needed
                 # The expansions parameter in get_mentions should handle most original tweet context
-                if conversation_id and mention_id and str(conversation_id) != str(mention_id):
-                    logger.info(f"Mention {mention_id} is a reply but original tweet context not available in API response")
-                    logger.info(f"Bot will respond with general context (expansions parameter should handle most cases)")
+                # Both IDs come back from the API as strings already
+                if conversation_id and mention_id and conversation_id != mention_id:
+                    logger.info("Mention %s is a reply but original tweet context not available in API response", mention_id)
+                    logger.info("Bot will respond with general context (expansions parameter should handle most cases)")
                 else:
-                    logger.info(f"Mention {mention_id} is not a reply")
-            
-            return base_context
-            
-        except Exception as e:
-            logger.error(f"Error getting mention context: {e}")
-            return "Someone on Twitter is asking for spiritual guidance"
-
-    def _store_interaction(self, mention: Dict, user_info: Dict = None):
-        """Store interaction in database"""
-        try:
-            # Ensure tweet_id is stored as a string for consistent database queries
-            tweet_id = str(mention['id']).strip()
-            user_id = str(mention['author_id']).strip()
-            
-            # Store interaction
-            self.db.execute_update('''
-                INSERT INTO interactions 
-                (tweet_id, user_id, username, mention_text, created_at, interaction_type)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (tweet_id) DO UPDATE SET
-                    user_id = EXCLUDED.user_id,
-                    username = EXCLUDED.username,
-                    mention_text = EXCLUDED.mention_text,
-                    created_at = EXCLUDED.created_at,
-                    interaction_type = EXCLUDED.interaction_type
-            ''', (
-                tweet_id,
-                user_id,
-                user_info['username'] if user_info else None,
-                mention['text'],
-                mention['created_at'],
-                'mention'
-            ))
+                    logger.info("Mention %s is not a reply", mention_id)
             
-            # Update user information
-            self.db.execute_update('''
-                INSERT INTO users 
-                (user_id, username, last_interaction, interaction_count)
-                VALUES (%s, %s, %s, 1)
-                ON CONFLICT (user_id) DO UPDATE SET
-                    username = EXCLUDED.username,
-                    last_interaction = EXCLUDED.last_interaction,
-                    interaction_count = users.interaction_count + 1
-            ''', (
-                mention['author_id'],
-                user_info['username'] if user_info else None,
-                datetime.now()
-            ))
+            return _BASE_CONTEXT
             
         except Exception as e:
-            logger.error(f"Error storing interaction: {e}")
+            logger.error("Error getting mention context: %s", e)
+            return _BASE_CONTEXT
 
-    def _update_interaction_response(self, mention_id: str, response_text: str, reply_tweet_id: str, status: str = 'completed'):
-        """Update interaction with response information (creates record if it doesn't exist)
+    def _record_mention(self, mention: Dict, response_text: str, reply_tweet_id: Optional[str], status: str, now: datetime) -> bool:
+        """Record the outcome of a mention; errors are logged, since the reply may already be posted
         
-        Args:
-            mention_id: The tweet ID we're responding to
-            response_text: The response text we generated
-            reply_tweet_id: The ID of our reply tweet (None if failed)
-            status: Status to set ('completed', 'failed', 'no_reply', etc.)
+        Returns:
+            True if the outcome was written
         """
         try:
-            # Ensure tweet_id is a string for consistent database queries
-            tweet_id_str = str(mention_id).strip()
-            response_id_str = str(reply_tweet_id).strip() if reply_tweet_id else None
-            
-            logger.info(f"💾 Updating interaction response: tweet_id={tweet_id_str}, response_id={response_id_str}, status={status}")
-            
-            # Use INSERT ... ON CONFLICT to ensure record exists (upsert)
-            # This handles the case where _store_interaction failed or record was deleted
-            self.db.execute_update('''
-                INSERT INTO interactions 
-                (tweet_id, response_text, response_tweet_id, responded_at, status)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (tweet_id) DO UPDATE SET
-                    response_text = EXCLUDED.response_text,
-                    response_tweet_id = EXCLUDED.response_tweet_id,
-                    responded_at = EXCLUDED.responded_at,
-                    status = EXCLUDED.status
-            ''', (tweet_id_str, response_text, response_id_str, datetime.now(), status))
-            
-            logger.info(f"✅ Successfully updated/created interaction response for tweet_id: {tweet_id_str} with status: {status}")
-            
-        except Exception as e:
-            logger.error(f"Error updating interaction response: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            self._record_interaction(
+                mention['id'], mention['author_id'], mention['text'], response_text, reply_tweet_id,
+                interaction_type='mention', now=now, status=status,
+                username=self._mention_user_info(mention)['username'],
+                created_at=mention.get('created_at')
+            )
+            return True
+        except Exception:
+            return False  # Already logged by _record_interaction
 
-    def _record_interaction(self, tweet_id: str, user_id: str, tweet_text: str, response_text: str, reply_tweet_id: str, interaction_type: str = 'interaction'):
+    def _record_interaction(self, tweet_id: str, user_id: str, tweet_text: str, response_text: str, reply_tweet_id: str,
+                            interaction_type: str = 'interaction', now: Optional[datetime] = None, status: str = 'completed',
+                            username: Optional[str] = None, created_at=None):
         """Record a complete interaction (tweet and reply) in the database
         
         This method stores both the original tweet ID and the reply tweet ID,
@@ -313,6 +608,11 @@ class InteractionHandler:
             response_text: The text of our reply
             reply_tweet_id: The ID of our reply tweet
             interaction_type: Type of interaction (e.g., 'mention', 'prayer_response')
+            now: Time of the interaction (defaults to the current time)
+            status: Status to set ('completed', 'failed', 'no_reply')
+            username: The user's screen name, if known
+            created_at: When the original tweet was posted (datetime or ISO string);
+                defaults to now
         """
         try:
             # Ensure IDs are stored as strings for consistent database queries
@@ -320,48 +620,39 @@ class InteractionHandler:
             user_id_str = str(user_id).strip()
             reply_tweet_id_str = str(reply_tweet_id).strip() if reply_tweet_id else None
             
-            logger.info(f"💾 Recording interaction: tweet_id={tweet_id_str}, reply_id={reply_tweet_id_str}, type={interaction_type}")
-            
-            # Insert or update interaction with all information in one operation
-            self.db.execute_update('''
-                INSERT INTO interactions 
-                (tweet_id, user_id, mention_text, response_text, response_tweet_id, 
-                 created_at, responded_at, interaction_type, status)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (tweet_id) DO UPDATE SET
-                    user_id = EXCLUDED.user_id,
-                    mention_text = EXCLUDED.mention_text,
-                    response_text = EXCLUDED.response_text,
-                    response_tweet_id = EXCLUDED.response_tweet_id,
-                    responded_at = EXCLUDED.responded_at,
-                    interaction_type = EXCLUDED.interaction_type,
-                    status = 'completed'
-            ''', (
+            logger.info("💾 Recording interaction: tweet_id=%s, reply_id=%s, type=%s, status=%s", tweet_id_str, reply_tweet_id_str, interaction_type, status)
+            
+            # The reply is out, so it counts even if the write below fails
+            if status == 'completed' and reply_tweet_id_str:
+                self._note_reply()
+            
+            now = now or datetime.now()
+            
+            # created_at is a datetime from tweepy or an ISO string from the raw API;
+            # send it as text and let Postgres parse it
+            created_at_str = str(created_at) if created_at is not None else str(now)
+            
+            # Insert or update interaction and user information in one statement
+            self.db.execute_update(_SQL_RECORD_INTERACTION, (
                 tweet_id_str,
                 user_id_str,
+                username,
                 tweet_text,
                 response_text,
                 reply_tweet_id_str,
-                datetime.now(),  # created_at
-                datetime.now(),  # responded_at
+                created_at_str,
+                now,  # responded_at
                 interaction_type,
-                'completed'
+                status,
+                now  # users.last_interaction
             ))
+            self._remember_user_interaction(user_id_str, now)
+            self._mark_responded(tweet_id_str)
             
-            # Also update user information
-            self.db.execute_update('''
-                INSERT INTO users 
-                (user_id, last_interaction, interaction_count)
-                VALUES (%s, %s, 1)
-                ON CONFLICT (user_id) DO UPDATE SET
-                    last_interaction = EXCLUDED.last_interaction,
-                    interaction_count = users.interaction_count + 1
-            ''', (user_id_str, datetime.now()))
-            
-            logger.info(f"✅ Recorded interaction: tweet_id={tweet_id_str}, reply_id={reply_tweet_id_str}, type={interaction_type}")
+            logger.info("✅ Recorded interaction: tweet_id=%s, reply_id=%s, type=%s", tweet_id_str, reply_tweet_id_str, interaction_type)
             
         except Exception as e:
-            logger.error(f"Error recording interaction: {e}")
+            logger.error("Error recording interaction: %s", e)
             raise  # Re-raise to ensure caller knows if recording failed
 
     def _has_responded_to_tweet(self, tweet_id: str) -> bool:
@@ -371,94 +662,197 @@ class InteractionHandler:
         that quickly exhaust the monthly quota. The database is the source of truth.
         """
         try:
-            # Verify database is initialized
-            if not hasattr(self, 'db') or self.db is None:
-                logger.error(f"❌ CRITICAL: Database not initialized!")
-                return False
-            
             # Ensure tweet_id is a string for consistent database comparison
             tweet_id_str = str(tweet_id).strip()
+            if self._is_known_responded(tweet_id_str):
+                return True
             
             # Check our database only - no API calls to preserve quota
-            query = 'SELECT response_tweet_id, status FROM interactions WHERE tweet_id = %s'
-            results = self.db.execute_query(query, (tweet_id_str,))
-            
-            if results and len(results) > 0:
-                result = results[0]
-                response_tweet_id = result.get('response_tweet_id')
-                status = result.get('status', 'unknown')
-                
-                # Check if we have a response tweet ID (not NULL) - means we successfully responded
-                if response_tweet_id is not None and str(response_tweet_id).strip():
-                    logger.info(f"✅ Already responded to tweet {tweet_id_str} (response_id: {response_tweet_id})")
-                    return True
-                # Check if status is 'failed' - we attempted but failed, don't retry immediately
-                elif status == 'failed':
-                    logger.info(f"⚠️  Previous attempt to respond to {tweet_id_str} failed - skipping retry")
-                    return True  # Return True to prevent retry
-                # Check if status is 'no_reply' - AI decided not to reply
-                elif status == 'no_reply':
-                    logger.info(f"⚠️  Previously decided not to reply to {tweet_id_str}")
-                    return True  # Return True to prevent retry
-                else:
-                    # Record exists but no response_tweet_id - might be pending or incomplete
-                    logger.debug(f"Database record exists for {tweet_id_str} but response_tweet_id is NULL (status: {status})")
-                    return False
-            else:
-                # No record found in database
+            results = self.db.execute_query(_SQL_TWEET_STATUS, (tweet_id_str,))
+            if not results:
                 return False
             
+            response_tweet_id = results[0]['response_tweet_id']
+            status = results[0]['status']
+            
+            # A reply was posted, or a previous attempt failed / chose not to reply - don't retry.
+            # Otherwise the record is pending or incomplete.
+            responded = (response_tweet_id is not None and bool(str(response_tweet_id).strip())) or status in ('failed', 'no_reply')
+            logger.debug("Tweet %s: responded=%s (response_id: %s, status: %s)", tweet_id_str, responded, response_tweet_id, status)
+            if responded:
+                self._mark_responded(tweet_id_str)
+            return responded
+            
         except Exception as e:
-            logger.error(f"❌ Error checking if responded to tweet {tweet_id}: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("❌ Error checking if responded to tweet %s: %s", tweet_id, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             # If database fails, err on side of caution - assume not replied (but don't make API call)
             return False
 
-    def _is_user_rate_limited(self, user_id: str) -> bool:
-        """Check if user is rate limited"""
+    def _is_known_responded(self, tweet_id: str) -> bool:
+        """Check the in-process cache of handled tweet IDs"""
+        with self._responded_lock:
+            if tweet_id in self._responded_cache:
+                self._responded_cache.move_to_end(tweet_id)
+                return True
+            return False
+
+    def _mark_responded(self, tweet_id: str):
+        """Add a handled tweet ID to the in-process cache, evicting the least recently used"""
+        with self._responded_lock:
+            self._responded_cache[tweet_id] = None
+            self._responded_cache.move_to_end(tweet_id)
+            if len(self._responded_cache) > self.responded_cache_size:
+                self._responded_cache.popitem(last=False)
+
+    def _load_responded(self):
+        """Seed the responded cache with the most recently handled tweet IDs
+        
+        Misses still fall back to the database, so a partial seed is safe.
+        """
         try:
-            # Check last interaction time
-            results = self.db.execute_query(
-                'SELECT last_interaction FROM users WHERE user_id = %s', 
-                (user_id,)
-            )
-            
-            if results:
-                last_interaction = datetime.fromisoformat(results[0]['last_interaction'])
-                time_diff = (datetime.now() - last_interaction).total_seconds()
-                
-                if time_diff < self.response_cooldown:
-                    logger.info(f"User {user_id} is rate limited")
-                    return True
+            rows = self.db.execute_query(_SQL_RECENT_HANDLED, (self.responded_cache_size,))
+        except Exception as e:
+            logger.warning("Could not load handled tweet IDs: %s", e)
+            return
+        
+        # Oldest first, so the newest end up most recently used
+        with self._responded_lock:
+            for row in reversed(rows):
+                self._responded_cache[row['tweet_id']] = None
+
+    def _filter_unresponded(self, tweet_ids: List[str]) -> Set[str]:
+        """Return the subset of tweet_ids we haven't handled yet, in one query
+        
+        Uses the same rules as _has_responded_to_tweet: a reply was posted, or a
+        previous attempt was marked 'failed' or 'no_reply'.
+        """
+        unknown = [tid for tid in tweet_ids if not self._is_known_responded(tid)]
+        if not unknown:
+            return set()
+        
+        try:
+            results = self.db.execute_query(_SQL_HANDLED_AMONG, (unknown,))
             
-            return False
+            responded = {row['tweet_id'] for row in results}
+            for tid in responded:
+                self._mark_responded(tid)
+            return set(unknown) - responded
             
         except Exception as e:
-            logger.error(f"Error checking user rate limit: {e}")
-            return False
+            logger.error("❌ Error checking responded tweets: %s", e)
+            # Same fallback as _has_responded_to_tweet: assume not replied
+            return set(unknown)
 
-    def _hourly_response_limit_reached(self) -> bool:
-        """Check if hourly response limit is reached"""
+    def _gating_signals(self, tweet_id: str, user_id: str, responded: Optional[bool] = None) -> Dict:
+        """Collect the responded / user cooldown / hourly limit signals for a mention
+        
+        The cooldown and hourly limit come from in-process state seeded at startup.
+        Whether the tweet was already handled comes from the responded cache, falling
+        back to one query; pass responded when the caller already has it from the
+        batch lookup in _filter_mentions.
+        
+        Returns:
+            Dict with 'responded' (bool), 'last_interaction' (datetime or None,
+            only set while inside the cooldown) and 'hourly_count' (int, completed
+            replies in the last hour)
+        """
+        tweet_id = str(tweet_id).strip()
+        user_id = str(user_id).strip()
+        
+        signals = {
+            'responded': self._is_known_responded(tweet_id) if responded is None else responded,
+            'last_interaction': None,
+            'hourly_count': self._hourly_reply_count()
+        }
+        
+        with self._user_lock:
+            last_seen = self._user_last_interaction.get(user_id)
+        if last_seen is not None and time.time() - last_seen < self.response_cooldown:
+            signals['last_interaction'] = datetime.fromtimestamp(last_seen)
+        
+        if responded is None and not signals['responded']:
+            try:
+                row = self.db.execute_query(_SQL_TWEET_HANDLED, (tweet_id,))
+            except Exception as e:
+                # Like the individual checks did, fail open rather than stop answering mentions
+                logger.error("Error checking response limits for tweet %s: %s", tweet_id, e)
+                return signals
+            if row and row[0]['responded']:
+                signals['responded'] = True
+                self._mark_responded(tweet_id)
+        
+        return signals
+
+    def _load_recent_replies(self):
+        """Seed the hourly sliding window with the last hour's completed replies"""
         try:
-            one_hour_ago = datetime.now() - timedelta(hours=1)
-            
-            results = self.db.execute_query(
-                'SELECT COUNT(*) as count FROM interactions WHERE responded_at > %s AND status = %s',
-                (one_hour_ago, 'completed')
+            now = datetime.now()
+            rows = self.db.execute_query(
+                "SELECT responded_at FROM interactions WHERE responded_at > %s AND status = 'completed'",
+                (now - timedelta(hours=1),)
             )
-            
-            count = results[0]['count']
-            
-            if count >= self.max_responses_per_hour:
-                logger.warning(f"Hourly response limit reached: {count}/{self.max_responses_per_hour}")
-                return True
-            
-            return False
-            
         except Exception as e:
-            logger.error(f"Error checking hourly limit: {e}")
-            return False
+            # Fail open, like the limit check always has
+            logger.warning("Could not load recent replies for the hourly limit: %s", e)
+            return
+        
+        # Map wall-clock reply times onto the monotonic clock the window runs on
+        mono_now = time.monotonic()
+        times = sorted(mono_now - (now - _as_local_datetime(row['responded_at'])).total_seconds() for row in rows)
+        with self._recent_replies_lock:
+            self._recent_replies.extend(times)
+
+    def _note_reply(self):
+        """Count a completed reply towards the hourly limit"""
+        with self._recent_replies_lock:
+            self._recent_replies.append(time.monotonic())
+
+    def _hourly_reply_count(self) -> int:
+        """Number of completed replies in the last hour"""
+        cutoff = time.monotonic() - 3600
+        with self._recent_replies_lock:
+            while self._recent_replies and self._recent_replies[0] <= cutoff:
+                self._recent_replies.popleft()
+            return len(self._recent_replies)
+
+    def _load_recent_users(self):
+        """Seed the user cache with everyone still inside their cooldown
+        
+        Only this process writes users.last_interaction, so after this the cache
+        alone answers the cooldown check.
+        """
+        try:
+            rows = self.db.execute_query(
+                "SELECT user_id, last_interaction FROM users WHERE last_interaction > %s ORDER BY last_interaction",
+                (datetime.now() - timedelta(seconds=self.response_cooldown),)
+            )
+        except Exception as e:
+            # Fail open, like the rate limit check always has
+            logger.warning("Could not load recent user interactions: %s", e)
+            return
+        
+        for row in rows:
+            self._remember_user_interaction(row['user_id'], _as_local_datetime(row['last_interaction']))
+
+    def _remember_user_interaction(self, user_id: str, when: datetime):
+        """Record a user's last interaction time in the in-process cache"""
+        # Stored as epoch seconds, so the cooldown check is a float compare
+        when = when.timestamp()
+        with self._user_lock:
+            cache = self._user_last_interaction
+            user_id = str(user_id).strip()
+            cache[user_id] = when
+            cache.move_to_end(user_id)
+            
+            if len(cache) > self.user_cache_size:
+                # Drop entries past the cooldown first; they no longer affect rate limiting
+                cutoff = time.time() - self.response_cooldown
+                for uid, ts in list(cache.items()):
+                    if ts < cutoff:
+                        del cache[uid]
+                # Then the least recently seen, if it's still over the bound
+                while len(cache) > self.user_cache_size:
+                    cache.popitem(last=False)
 
     def get_interaction_stats(self) -> Dict:
         """Get statistics about interactions"""
@@ -1,37 +1,31 @@
 """
 Main application for InChrist AI Twitter Bot
 """
+import json
 import logging
 import schedule
-import time
 import sys
 import signal
 import os
+import select
+import socket
 from datetime import datetime
 from typing import Dict, List
 import pytz
 
 # Use cloud config if available, fallback to local config
+cloud_deployment = os.getenv('CLOUD_DEPLOYMENT')
+port_set = os.getenv('PORT')
 try:
-    cloud_deployment = os.getenv('CLOUD_DEPLOYMENT')
-    port_set = os.getenv('PORT')
-    print(f"DEBUG: CLOUD_DEPLOYMENT={cloud_deployment}, PORT={port_set}")
-    
     if cloud_deployment or port_set:
         import config_cloud as config
-        print("DEBUG: Successfully imported config_cloud")
-        logger_setup = logging.getLogger(__name__)
-        logger_setup.info("Using cloud configuration")
+        _CONFIG_SOURCE = "cloud configuration"
     else:
         import config
-        print("DEBUG: Using local config (no cloud env vars)")
-        logger_setup = logging.getLogger(__name__)
-        logger_setup.info("Using local configuration")
+        _CONFIG_SOURCE = "local configuration (no cloud env vars)"
 except ImportError as e:
-    print(f"DEBUG: ImportError when loading config: {e}")
     import config
-    logger_setup = logging.getLogger(__name__)
-    logger_setup.info("Using local configuration (cloud config not found)")
+    _CONFIG_SOURCE = f"local configuration (cloud config not found: {e})"
 
 from twitter_api import TwitterAPI
 from daily_poster import DailyPoster
@@ -39,6 +33,20 @@ from interaction_handler import InteractionHandler
 from web_server import start_health_server
 from ai_responses import AIResponseGenerator
 
+class JsonLogFormatter(logging.Formatter):
+    """One JSON object per record, for log ingestion (LOG_FORMAT=json)"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record),
+            'logger': record.name,
+            'level': record.levelname,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -48,8 +56,34 @@ logging.basicConfig(
         logging.StreamHandler(sys.stdout)
     ]
 )
+if os.getenv('LOG_FORMAT', 'text').lower() == 'json':
+    for handler in logging.getLogger().handlers:
+        handler.setFormatter(JsonLogFormatter())
 
 logger = logging.getLogger(__name__)
+logger.info("Using %s (CLOUD_DEPLOYMENT=%s, PORT=%s)", _CONFIG_SOURCE, cloud_deployment, port_set)
+
+def _normalize_posting_time(posting_time) -> str:
+    """Return posting_time as HH:MM (e.g. 8:00 -> 08:00), or 08:00 if it can't be read"""
+    if not isinstance(posting_time, str):
+        logger.warning("posting_time is not a string: %s, using default 08:00", posting_time)
+        return "08:00"
+    
+    time_parts = posting_time.strip().split(':')
+    if len(time_parts) != 2:
+        logger.warning("Invalid time format: %s, using default 08:00", posting_time)
+        return "08:00"
+    
+    # Add leading zeros if needed
+    hour, minute = time_parts
+    return f"{hour.zfill(2)}:{minute.zfill(2)}"
+
+# Config values used by start(), resolved once at import
+_POSTING_TIME = _normalize_posting_time(getattr(config, 'POSTING_TIME', None))
+_BOT_TIMEZONE = getattr(config, 'TIMEZONE', 'America/New_York')
+_CONFIG_PORT = getattr(config, 'PORT', None)
+_PRAYER_SEARCH_COUNT = getattr(config, 'PRAYER_SEARCH_COUNT', 5)
+_PRAYER_SEARCH_INTERVAL_DAYS = getattr(config, 'PRAYER_SEARCH_INTERVAL_DAYS', 3)
 
 class InChristAI:
     def __init__(self, dry_run=False):
@@ -60,17 +94,31 @@ class InChristAI:
         self.running = False
         self.dry_run = dry_run
         self.web_server = None
+        self._signum = None
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
 
     def _signal_handler(self, signum, frame):
-        """Handle shutdown signals gracefully"""
-        logger.info(f"Received signal {signum}, shutting down gracefully...")
+        """Handle shutdown signals gracefully
+        
+        Only clears the running flag; the main loop is woken through the signal wakeup
+        fd and does the logging and shutdown work. The handler can interrupt the main
+        thread anywhere, including inside a logging call or a lock it already holds.
+        """
         self.running = False
-        if self.web_server:
-            self.web_server.stop()
+
+    def _drain_wakeup(self, sock):
+        """Read the signal numbers queued on the wakeup socket, keeping the last"""
+        try:
+            while True:
+                data = sock.recv(64)
+                if not data:
+                    break
+                self._signum = data[-1]
+        except (BlockingIOError, InterruptedError):
+            pass
 
     def start(self):
         """Start the bot with scheduled tasks"""
@@ -105,38 +153,14 @@ class InChristAI:
                 logger.warning(f"Could not check actual API usage on startup: {e}")
             
             # Start health check web server for cloud deployment
-            if hasattr(config, 'PORT'):
-                self.web_server = start_health_server(self, config.PORT)
-            
-            # Schedule daily verse posting
-            posting_time = config.POSTING_TIME
-            logger.info(f"DEBUG: Raw posting_time from config: '{posting_time}' (type: {type(posting_time)})")
-            
-            # Ensure proper time format (convert 8:00 to 08:00 format)
-            if isinstance(posting_time, str):
-                posting_time = posting_time.strip()
-                # Handle both H:MM and HH:MM formats
-                if ':' in posting_time:
-                    time_parts = posting_time.split(':')
-                    if len(time_parts) == 2:
-                        hour, minute = time_parts
-                        # Add leading zero to hour if needed
-                        hour = hour.zfill(2)
-                        minute = minute.zfill(2)
-                        posting_time = f"{hour}:{minute}"
-                        logger.info(f"DEBUG: Normalized time format: {posting_time}")
-                    else:
-                        logger.warning(f"DEBUG: Invalid time format: {posting_time}, using default 08:00")
-                        posting_time = "08:00"
-                else:
-                    logger.warning(f"DEBUG: No colon in time format: {posting_time}, using default 08:00")
-                    posting_time = "08:00"
-            else:
-                logger.warning(f"DEBUG: posting_time is not a string: {posting_time}, using default 08:00")
-                posting_time = "08:00"
+            if _CONFIG_PORT is not None:
+                self.web_server = start_health_server(self, _CONFIG_PORT)
+            
+            # Schedule daily verse posting (normalized to HH:MM at import)
+            posting_time = _POSTING_TIME
             
             # Get timezone for scheduling
-            bot_timezone = getattr(config, 'TIMEZONE', 'America/New_York')
+            bot_timezone = _BOT_TIMEZONE
             logger.info(f"Using timezone: {bot_timezone}")
             
             # Create timezone-aware scheduler
@@ -153,8 +177,8 @@ class InChristAI:
             
             # Schedule prayer search every 3 days (X API Free tier: 100 calls/month limit)
             # NOTE: Each returned tweet counts as 1 API call, not just the search request
-            search_count = getattr(config, 'PRAYER_SEARCH_COUNT', 5)
-            search_interval = getattr(config, 'PRAYER_SEARCH_INTERVAL_DAYS', 3)
+            search_count = _PRAYER_SEARCH_COUNT
+            search_interval = _PRAYER_SEARCH_INTERVAL_DAYS
             
             self._schedule_interval_task("10:00", bot_timezone, search_interval, 
                                         lambda: self._search_and_respond_to_prayers(dry_run=self.dry_run), 
@@ -172,11 +196,33 @@ class InChristAI:
             self.running = True
             logger.info("Bot started successfully! Press Ctrl+C to stop.")
             
-            # Main loop
-            while self.running:
-                schedule.run_pending()
-                time.sleep(1)
-                
+            # Main loop: sleep until the next scheduled job (re-checking at least hourly)
+            # instead of waking every second. Python writes each signal's number to the
+            # wakeup socket before the handler runs, so a shutdown signal ends the wait.
+            wake_r, wake_w = socket.socketpair()
+            wake_r.setblocking(False)
+            wake_w.setblocking(False)
+            old_wakeup_fd = signal.set_wakeup_fd(wake_w.fileno())
+            try:
+                while self.running:
+                    schedule.run_pending()
+                    idle = schedule.idle_seconds()
+                    if idle is None:
+                        idle = 3600
+                    idle = max(0, min(idle, 3600))
+                    readable, _, _ = select.select([wake_r], [], [], idle)
+                    if readable:
+                        self._drain_wakeup(wake_r)
+            finally:
+                signal.set_wakeup_fd(old_wakeup_fd)
+                wake_r.close()
+                wake_w.close()
+            
+            if self._signum is not None:
+                logger.info("Received signal %s, shutting down gracefully...", self._signum)
+            if self.web_server:
+                self.web_server.stop()
+            self.close()
             logger.info("Bot stopped.")
             return True
             
@@ -184,6 +230,11 @@ class InChristAI:
             logger.error(f"Error starting bot: {e}")
             return False
 
+    def close(self):
+        """Release the HTTP session and database pool held by the poster and handler"""
+        self.daily_poster.close()
+        self.interaction_handler.close()
+
     def _post_daily_verse(self, force=False):
         """Scheduled task to post daily verse"""
         try:
@@ -219,7 +270,7 @@ class InChristAI:
         try:
             # Step 1: Search for prayer-related tweets
             combined_query = "pray OR \"prayer request\" OR \"thoughts and prayers\""
-            search_count = getattr(config, 'PRAYER_SEARCH_COUNT', 5)
+            search_count = _PRAYER_SEARCH_COUNT
             
             tweets = self.twitter_api.search_tweets(combined_query, count=search_count)
             
@@ -533,6 +584,7 @@ Examples:
             if force and task == "post_verse":
                 logger.info("🔄 FORCE mode - will post even if already posted today!")
             success = bot.run_once(task, force=force)
+            bot.close()
             if success:
                 print(f"Task '{task}' completed successfully")
             else:
@@ -543,6 +595,7 @@ Examples:
             # Only check actual usage if explicitly requested to save API calls
             check_actual = "--check-usage" in sys.argv or "-u" in sys.argv
             status = bot.get_status(check_actual_usage=check_actual)
+            bot.close()
             print(f"Bot Status: {status}")
             if not check_actual:
                 print("\n💡 Tip: Use --check-usage or -u flag to see actual monthly API usage")
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Test script to verify blocked-word matching for mentions
+"""
+from interaction_handler import _compile_blocked_words
+
+BLOCKED_WORDS = ['spam', 'bot', 'fake', 'scam']
+
+def test_blocked_words_match_inflections():
+    """Blocked words are caught whole and with common inflections"""
+    pattern = _compile_blocked_words(BLOCKED_WORDS)
+    for text in ["Another bot", "Bots everywhere", "Watch out for scammers", "Stop spamming me", "FAKE account"]:
+        assert pattern.search(text), f"should be blocked: {text!r}"
+
+def test_blocked_words_ignore_other_words():
+    """Words that only contain or start with a blocked word pass"""
+    pattern = _compile_blocked_words(BLOCKED_WORDS)
+    for text in ["Pray for both my kids", "Sorry to bother you", "I build robot toys", "Scampering puppies"]:
+        assert not pattern.search(text), f"should not be blocked: {text!r}"
+
+def test_no_blocked_words():
+    """An empty list blocks nothing"""
+    assert _compile_blocked_words([]) is None
+
+if __name__ == "__main__":
+    test_blocked_words_match_inflections()
+    test_blocked_words_ignore_other_words()
+    test_no_blocked_words()
+    print("✅ All blocked-word tests passed!")
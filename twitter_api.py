@@ -3,6 +3,7 @@ Twitter API integration for posting and monitoring mentions
 """
 import tweepy
 import logging
+import requests
 from typing import List, Dict, Optional, Any
 # Use cloud config if available, fallback to local config
 try:
@@ -18,7 +19,7 @@ class TwitterAPI:
     _read_call_count = 0  # Session-only counter
     _read_call_limit = 100  # Monthly limit for free tier
     
-    def __init__(self, dry_run=False):
+    def __init__(self, dry_run=False, session: Optional[requests.Session] = None):
         self.api_key = config.TWITTER_API_KEY
         self.api_secret = config.TWITTER_API_SECRET
         self.access_token = config.TWITTER_ACCESS_TOKEN
@@ -30,6 +31,9 @@ class TwitterAPI:
         # Dry run mode - simulates posting without actually doing it
         self.dry_run = dry_run
         
+        # Reuse one HTTP session so direct v2 calls keep their TCP/TLS connection
+        self.session = session or requests.Session()
+        
         # Always initialize both OAuth 2.0 and 1.0a for maximum compatibility
         self.client = tweepy.Client(
             bearer_token=self.bearer_token,
@@ -61,28 +65,28 @@ class TwitterAPI:
             if hasattr(self, 'api_v1'):
                 user = self.api_v1.verify_credentials()
                 if user:
-                    logger.info(f"Successfully authenticated as @{user.screen_name} (OAuth 1.0a)")
+                    logger.info("Successfully authenticated as @%s (OAuth 1.0a)", user.screen_name)
                     return True
             
             return False
         except Exception as e:
-            logger.error(f"Failed to verify credentials: {e}")
+            logger.error("Failed to verify credentials: %s", e)
             return False
     
     def post_tweet(self, text: str, media_path: Optional[str] = None) -> Optional[str]:
         """Post a tweet and return the tweet ID"""
         try:
             if len(text) > 280:
-                logger.warning(f"Tweet text too long ({len(text)} chars), truncating...")
+                logger.warning("Tweet text too long (%s chars), truncating...", len(text))
                 text = text[:277] + "..."
             
             if self.dry_run:
                 # Simulate posting without actually doing it
                 fake_tweet_id = f"dry_run_{int(time.time())}"
-                logger.info(f"🏃‍♂️ DRY RUN - Would post tweet: {fake_tweet_id}")
-                logger.info(f"📝 Tweet content: {text}")
+                logger.info("🏃‍♂️ DRY RUN - Would post tweet: %s", fake_tweet_id)
+                logger.info("📝 Tweet content: %s", text)
                 if media_path:
-                    logger.info(f"📷 Would include media: {media_path}")
+                    logger.info("📷 Would include media: %s", media_path)
                 return fake_tweet_id
             
             # Try v2 API first (OAuth 2.0)
@@ -95,10 +99,10 @@ class TwitterAPI:
                     response = self.client.create_tweet(text=text)
                     if response.data:
                         tweet_id = response.data['id']
-                        logger.info(f"Successfully posted tweet via v2 API: {tweet_id}")
+                        logger.info("Successfully posted tweet via v2 API: %s", tweet_id)
                         return str(tweet_id)
                 except Exception as e:
-                    logger.warning(f"v2 API posting failed: {e}, trying v1.1...")
+                    logger.warning("v2 API posting failed: %s, trying v1.1...", e)
             
             # Fallback to v1.1 API
             if hasattr(self, 'api_v1'):
@@ -110,14 +114,14 @@ class TwitterAPI:
                     # Simple status update
                     tweet = self.api_v1.update_status(text)
                 
-                logger.info(f"Successfully posted tweet via v1.1 API: {tweet.id}")
+                logger.info("Successfully posted tweet via v1.1 API: %s", tweet.id)
                 return str(tweet.id)
             
             logger.error("No valid API client available for posting")
             return None
             
         except Exception as e:
-            logger.error(f"Failed to post tweet: {e}")
+            logger.error("Failed to post tweet: %s", e)
             return None
     
     def get_mentions_tweepy(self, since_id: Optional[str] = None, count: int = 20) -> List[Dict]:
@@ -128,43 +132,44 @@ class TwitterAPI:
             # Use v1.1 mentions_timeline (the correct and documented method)
             if hasattr(self, 'api_v1'):
                 try:
-                    logger.info(f"Getting mentions via v1.1 mentions_timeline API")
+                    logger.info("Getting mentions via v1.1 mentions_timeline API")
                     
                     # Use keyword arguments as required in tweepy v4
                     kwargs = {'count': count, 'include_entities': True, 'tweet_mode': 'extended'}
                     if since_id:
                         kwargs['since_id'] = since_id
-                        logger.info(f"Using since_id: {since_id}")
+                        logger.info("Using since_id: %s", since_id)
                     
-                    logger.info(f"v1.1 mentions_timeline parameters: {kwargs}")
+                    logger.info("v1.1 mentions_timeline parameters: %s", kwargs)
                     tweets = self.api_v1.mentions_timeline(**kwargs)
-                    logger.info(f"v1.1 API returned {len(tweets)} tweets")
+                    logger.info("v1.1 API returned %s tweets", len(tweets))
                     
                     for tweet in tweets:
                         mention_data = {
                             'id': str(tweet.id),
                             'text': tweet.full_text if hasattr(tweet, 'full_text') else tweet.text,
                             'author_id': str(tweet.author.id),
+                            'author_username': tweet.author.screen_name,
                             'created_at': tweet.created_at,
                             'conversation_id': str(tweet.id),  # v1.1 doesn't have conversation_id
                             'in_reply_to_user_id': str(tweet.in_reply_to_user_id) if tweet.in_reply_to_user_id else None,
                             'original_tweet': None  # v1.1 API doesn't support expansions, will require separate call if needed
                         }
                         mentions.append(mention_data)
-                        logger.info(f"Found mention: {tweet.full_text[:50] if hasattr(tweet, 'full_text') else tweet.text[:50]}... from @{tweet.author.screen_name}")
+                        logger.info("Found mention: %s... from @%s", tweet.full_text[:50] if hasattr(tweet, 'full_text') else tweet.text[:50], tweet.author.screen_name)
                         
-                    logger.info(f"Found {len(mentions)} mentions via v1.1 mentions_timeline")
+                    logger.info("Found %s mentions via v1.1 mentions_timeline", len(mentions))
                     return mentions
                     
                 except Exception as e:
-                    logger.warning(f"v1.1 mentions_timeline failed: {e}, trying search fallback...")
+                    logger.warning("v1.1 mentions_timeline failed: %s, trying search fallback...", e)
             
             # Fallback to v2 search API
                 
                 # Try alternative search without filters
                 try:
                     alt_query = self.bot_username  # Just the username without @
-                    logger.info(f"Trying alternative search with query: '{alt_query}'")
+                    logger.info("Trying alternative search with query: '%s'", alt_query)
                     
                     alt_kwargs = {
                         'query': alt_query,
@@ -175,10 +180,10 @@ class TwitterAPI:
                         alt_kwargs['since_id'] = since_id
                         
                     alt_tweets = self.client.search_recent_tweets(**alt_kwargs)
-                    logger.info(f"Alternative search returned: {type(alt_tweets)}, has data: {hasattr(alt_tweets, 'data') if alt_tweets else False}")
+                    logger.info("Alternative search returned: %s, has data: %s", type(alt_tweets), hasattr(alt_tweets, 'data') if alt_tweets else False)
                     
                     if alt_tweets and hasattr(alt_tweets, 'data') and alt_tweets.data:
-                        logger.info(f"Alternative search found {len(alt_tweets.data)} potential mentions")
+                        logger.info("Alternative search found %s potential mentions", len(alt_tweets.data))
                         for tweet in alt_tweets.data:
                             # Filter for actual mentions in the text
                             if f"@{self.bot_username.lower()}" in tweet.text.lower():
@@ -192,14 +197,14 @@ class TwitterAPI:
                                     'original_tweet': None  # Search fallback doesn't support expansions
                                 }
                                 mentions.append(mention_data)
-                                logger.info(f"Found mention via alternative search: {mention_data}")
+                                logger.info("Found mention via alternative search: %s", mention_data)
                         
                         if mentions:
-                            logger.info(f"Found {len(mentions)} mentions via alternative search")
+                            logger.info("Found %s mentions via alternative search", len(mentions))
                             return mentions
                             
                 except Exception as alt_e:
-                    logger.warning(f"Alternative search also failed: {alt_e}, trying v1.1...")
+                    logger.warning("Alternative search also failed: %s, trying v1.1...", alt_e)
             
             # Fallback to v1.1 API
             if hasattr(self, 'api_v1'):
@@ -220,14 +225,14 @@ class TwitterAPI:
                         'original_tweet': None  # v1.1 fallback doesn't support expansions
                     })
                     
-                logger.info(f"Found {len(mentions)} mentions via v1.1 API")
+                logger.info("Found %s mentions via v1.1 API", len(mentions))
                 return mentions
             
-            logger.info(f"Retrieved {len(mentions)} mentions")
+            logger.info("Retrieved %s mentions", len(mentions))
             return mentions
             
         except Exception as e:
-            logger.error(f"Failed to get mentions: {e}")
+            logger.error("Failed to get mentions: %s", e)
             return []
     
     def get_mentions(self, since_id: Optional[str] = None, count: int = 20) -> List[Dict]:
@@ -237,10 +242,9 @@ class TwitterAPI:
         Use this method sparingly - recommended: once per day maximum
         """
         try:
-            import requests
             
             # Use user ID from config (no API calls needed)
-            logger.info(f"Using user ID from config for mentions: {self.user_id}")
+            logger.info("Using user ID from config for mentions: %s", self.user_id)
             
             # Direct HTTP request to X API v2 mentions endpoint
             url = f"https://api.x.com/2/users/{self.user_id}/mentions"
@@ -253,18 +257,20 @@ class TwitterAPI:
             params = {
                 "max_results": min(count, 100),
                 "tweet.fields": "created_at,author_id,conversation_id,in_reply_to_user_id,referenced_tweets",
-                "expansions": "referenced_tweets.id"
+                # Authors come back in includes.users, so usernames need no follow-up lookups
+                "expansions": "referenced_tweets.id,author_id",
+                "user.fields": "username"
             }
             
             if since_id:
                 params["since_id"] = since_id
-                logger.info(f"Using since_id: {since_id}")
+                logger.info("Using since_id: %s", since_id)
             
-            logger.info(f"Making direct HTTP request to: {url}")
-            logger.info(f"Request parameters: {params}")
+            logger.info("Making direct HTTP request to: %s", url)
+            logger.info("Request parameters: %s", params)
             
-            response = requests.get(url, headers=headers, params=params)
-            logger.info(f"HTTP Response status: {response.status_code}")
+            response = self.session.get(url, headers=headers, params=params)
+            logger.info("HTTP Response status: %s", response.status_code)
             
             # Log rate limit headers for debugging and monitoring
             rate_limit_headers = {}
@@ -273,22 +279,22 @@ class TwitterAPI:
                     rate_limit_headers[header_name] = response.headers[header_name]
             
             if rate_limit_headers:
-                logger.info(f"🔢 API USAGE - Rate limit headers: {rate_limit_headers}")
+                logger.info("🔢 API USAGE - Rate limit headers: %s", rate_limit_headers)
                 # Extract key info for monitoring
                 remaining = rate_limit_headers.get('x-rate-limit-remaining', 'unknown')
                 reset_time = rate_limit_headers.get('x-rate-limit-reset', 'unknown')
-                logger.warning(f"📊 API BUDGET: {remaining} calls remaining until reset at {reset_time}")
+                logger.warning("📊 API BUDGET: %s calls remaining until reset at %s", remaining, reset_time)
             else:
                 logger.info("No rate limit headers found")
             
             # Track and log every API call for budget tracking
             TwitterAPI._read_call_count += 1
             remaining_budget = TwitterAPI._read_call_limit - TwitterAPI._read_call_count
-            logger.warning(f"💰 API READ CALL #{TwitterAPI._read_call_count} (session): get_mentions() - Session: {remaining_budget} remaining (NOTE: This counter resets on restart. Use get_actual_usage() for real monthly count)")
+            logger.warning("💰 API READ CALL #%s (session): get_mentions() - Session: %s remaining (NOTE: This counter resets on restart. Use get_actual_usage() for real monthly count)", TwitterAPI._read_call_count, remaining_budget)
             
             if response.status_code == 200:
                 data = response.json()
-                logger.info(f"Response data keys: {list(data.keys()) if data else 'None'}")
+                logger.info("Response data keys: %s", list(data.keys()) if data else 'None')
                 
                 # Build a lookup map for referenced tweets (original tweets)
                 referenced_tweets_map = {}
@@ -300,17 +306,20 @@ class TwitterAPI:
                             'author_id': str(ref_tweet['author_id']),
                             'created_at': ref_tweet['created_at']
                         }
-                    logger.info(f"Found {len(referenced_tweets_map)} referenced tweets in includes")
+                    logger.info("Found %s referenced tweets in includes", len(referenced_tweets_map))
+                
+                usernames = {str(user['id']): user.get('username') for user in data.get('includes', {}).get('users', [])}
                 
                 mentions = []
                 if 'data' in data and data['data']:
-                    logger.info(f"Found {len(data['data'])} mentions via direct HTTP")
+                    logger.info("Found %s mentions via direct HTTP", len(data['data']))
                     
                     for tweet_data in data['data']:
                         mention_data = {
                             'id': str(tweet_data['id']),
                             'text': tweet_data['text'],
                             'author_id': str(tweet_data['author_id']),
+                            'author_username': usernames.get(str(tweet_data['author_id'])),
                             'created_at': tweet_data['created_at'],
                             'conversation_id': str(tweet_data.get('conversation_id', tweet_data['id'])),
                             'in_reply_to_user_id': str(tweet_data['in_reply_to_user_id']) if tweet_data.get('in_reply_to_user_id') else None,
@@ -324,11 +333,11 @@ class TwitterAPI:
                                     ref_tweet_id = str(ref_tweet['id'])
                                     if ref_tweet_id in referenced_tweets_map:
                                         mention_data['original_tweet'] = referenced_tweets_map[ref_tweet_id]
-                                        logger.info(f"Mention {mention_data['id']} has original tweet context: {mention_data['original_tweet']['text'][:50]}...")
+                                        logger.info("Mention %s has original tweet context: %s...", mention_data['id'], mention_data['original_tweet']['text'][:50])
                                         break
                         
                         mentions.append(mention_data)
-                        logger.info(f"Found mention: {tweet_data['text'][:50]}... from user {tweet_data['author_id']}")
+                        logger.info("Found mention: %s... from user %s", tweet_data['text'][:50], tweet_data['author_id'])
                     
                     return mentions
                 else:
@@ -336,16 +345,16 @@ class TwitterAPI:
                     return []
             
             elif response.status_code == 429:
-                logger.warning(f"Rate limit exceeded (429). Response: {response.text}")
+                logger.warning("Rate limit exceeded (429). Response: %s", response.text)
                 return []
             else:
-                logger.error(f"HTTP request failed with status {response.status_code}: {response.text}")
+                logger.error("HTTP request failed with status %s: %s", response.status_code, response.text)
                 # Fallback to tweepy method
                 logger.info("Falling back to tweepy method...")
                 return self.get_mentions_tweepy(since_id=since_id, count=count)
                 
         except Exception as e:
-            logger.error(f"Direct HTTP mentions request failed: {e}")
+            logger.error("Direct HTTP mentions request failed: %s", e)
             # Fallback to tweepy method
             logger.info("Falling back to tweepy method...")
             return self.get_mentions_tweepy(since_id=since_id, count=count)
@@ -354,14 +363,14 @@ class TwitterAPI:
         """Reply to a specific tweet"""
         try:
             if len(reply_text) > 280:
-                logger.warning(f"Reply text too long ({len(reply_text)} chars), truncating...")
+                logger.warning("Reply text too long (%s chars), truncating...", len(reply_text))
                 reply_text = reply_text[:277] + "..."
             
             if self.dry_run:
                 # Simulate replying without actually doing it
                 fake_reply_id = f"dry_run_reply_{int(time.time())}"
-                logger.info(f"🏃‍♂️ DRY RUN - Would reply to tweet {tweet_id}: {fake_reply_id}")
-                logger.info(f"💬 Reply content: {reply_text}")
+                logger.info("🏃‍♂️ DRY RUN - Would reply to tweet %s: %s", tweet_id, fake_reply_id)
+                logger.info("💬 Reply content: %s", reply_text)
                 return fake_reply_id
             
             # Try v2 API first (OAuth 2.0)
@@ -370,23 +379,23 @@ class TwitterAPI:
                     response = self.client.create_tweet(text=reply_text, in_reply_to_tweet_id=tweet_id)
                     if response.data:
                         reply_id = response.data['id']
-                        logger.info(f"Successfully replied via v2 API to tweet {tweet_id}: {reply_id}")
+                        logger.info("Successfully replied via v2 API to tweet %s: %s", tweet_id, reply_id)
                         return str(reply_id)
                 except Exception as e:
-                    logger.warning(f"v2 API reply failed (likely access level issue): {e}")
+                    logger.warning("v2 API reply failed (likely access level issue): %s", e)
                     logger.info("Falling back to v1.1 API for reply...")
             
             # Fallback to v1.1 API
             if hasattr(self, 'api_v1'):
                 logger.info("Attempting v1.1 API reply...")
-                logger.info(f"Using v1.1 endpoint: POST statuses/update with in_reply_to_status_id={tweet_id}")
+                logger.info("Using v1.1 endpoint: POST statuses/update with in_reply_to_status_id=%s", tweet_id)
                 reply = self.api_v1.update_status(
                     status=reply_text,
                     in_reply_to_status_id=tweet_id,
                     auto_populate_reply_metadata=True
                 )
                 
-                logger.info(f"Successfully replied via v1.1 API to tweet {tweet_id}: {reply.id}")
+                logger.info("Successfully replied via v1.1 API to tweet %s: %s", tweet_id, reply.id)
                 return str(reply.id)
             else:
                 logger.error("api_v1 client not available - missing OAuth 1.0a credentials?")
@@ -395,7 +404,7 @@ class TwitterAPI:
             return None
             
         except Exception as e:
-            logger.error(f"Failed to reply to tweet {tweet_id}: {e}")
+            logger.error("Failed to reply to tweet %s: %s", tweet_id, e)
             return None
     
     def get_user_info(self, user_id: str) -> Optional[Dict]:
@@ -419,7 +428,7 @@ class TwitterAPI:
             return None
             
         except Exception as e:
-            logger.error(f"Failed to get user info for {user_id}: {e}")
+            logger.error("Failed to get user info for %s: %s", user_id, e)
             return None
     
     def search_tweets(self, query: str, count: int = 5, include_thread_context: bool = False) -> List[Dict]:
@@ -437,7 +446,6 @@ class TwitterAPI:
             List of tweet dictionaries with optional thread context
         """
         try:
-            import requests
             
             # Ensure count is within Twitter API limits (10-100)
             api_count = max(10, min(count, 100))
@@ -456,13 +464,13 @@ class TwitterAPI:
                 "tweet.fields": "created_at,author_id,public_metrics,conversation_id,in_reply_to_user_id"
             }
             
-            logger.info(f"Making direct HTTP search request to: {url}")
-            logger.info(f"Search query: '{query}', max_results: {api_count}")
-            logger.warning(f"⚠️  INVESTIGATING: Checking if X API counts each returned tweet as a separate call")
-            logger.warning(f"   If so, requesting {api_count} tweets might use {api_count} API calls instead of 1")
+            logger.info("Making direct HTTP search request to: %s", url)
+            logger.info("Search query: '%s', max_results: %s", query, api_count)
+            logger.warning("⚠️  INVESTIGATING: Checking if X API counts each returned tweet as a separate call")
+            logger.warning("   If so, requesting %s tweets might use %s API calls instead of 1", api_count, api_count)
             
-            response = requests.get(url, headers=headers, params=params)
-            logger.info(f"HTTP Response status: {response.status_code}")
+            response = self.session.get(url, headers=headers, params=params)
+            logger.info("HTTP Response status: %s", response.status_code)
             
             # Log rate limit headers for debugging and monitoring
             rate_limit_headers = {}
@@ -471,29 +479,29 @@ class TwitterAPI:
                     rate_limit_headers[header_name] = response.headers[header_name]
             
             if rate_limit_headers:
-                logger.info(f"🔢 API USAGE - Rate limit headers: {rate_limit_headers}")
+                logger.info("🔢 API USAGE - Rate limit headers: %s", rate_limit_headers)
                 # Extract key info for monitoring
                 remaining = rate_limit_headers.get('x-rate-limit-remaining', 'unknown')
                 reset_time = rate_limit_headers.get('x-rate-limit-reset', 'unknown')
-                logger.warning(f"📊 API BUDGET: {remaining} calls remaining until reset at {reset_time}")
+                logger.warning("📊 API BUDGET: %s calls remaining until reset at %s", remaining, reset_time)
             
             # Track and log every API call for budget tracking
             # NOTE: We increment by 1 assuming 1 request = 1 call, but X API might count differently
             TwitterAPI._read_call_count += 1
             remaining_budget = TwitterAPI._read_call_limit - TwitterAPI._read_call_count
-            logger.warning(f"💰 API READ CALL #{TwitterAPI._read_call_count} (session): search_tweets('{query}') - Session: {remaining_budget} remaining (NOTE: This counter assumes 1 request = 1 call, but X API might count each returned tweet)")
+            logger.warning("💰 API READ CALL #%s (session): search_tweets('%s') - Session: %s remaining (NOTE: This counter assumes 1 request = 1 call, but X API might count each returned tweet)", TwitterAPI._read_call_count, query, remaining_budget)
             
             if response.status_code == 200:
                 data = response.json()
-                logger.info(f"Response data keys: {list(data.keys()) if data else 'None'}")
+                logger.info("Response data keys: %s", list(data.keys()) if data else 'None')
                 
                 results = []
                 tweets_returned = 0
                 if 'data' in data and data['data']:
                     tweets_returned = len(data['data'])
-                    logger.info(f"Found {tweets_returned} tweets via direct HTTP search")
-                    logger.warning(f"⚠️  If X API counts each tweet as a call, this request used {tweets_returned} calls, not 1!")
-                    logger.warning(f"   Please check actual monthly usage after this call to verify")
+                    logger.info("Found %s tweets via direct HTTP search", tweets_returned)
+                    logger.warning("⚠️  If X API counts each tweet as a call, this request used %s calls, not 1!", tweets_returned)
+                    logger.warning("   Please check actual monthly usage after this call to verify")
                     
                     for tweet_data in data['data']:
                         tweet_result = {
@@ -513,7 +521,7 @@ class TwitterAPI:
                             tweet_result['thread_context'] = thread_context
                         
                         results.append(tweet_result)
-                        logger.info(f"Found tweet: {tweet_data['text'][:50]}... from user {tweet_data['author_id']}")
+                        logger.info("Found tweet: %s... from user %s", tweet_data['text'][:50], tweet_data['author_id'])
                     
                     return results
                 else:
@@ -521,14 +529,14 @@ class TwitterAPI:
                     return []
             
             elif response.status_code == 429:
-                logger.warning(f"Rate limit exceeded (429). Response: {response.text}")
+                logger.warning("Rate limit exceeded (429). Response: %s", response.text)
                 return []
             else:
-                logger.error(f"HTTP search request failed with status {response.status_code}: {response.text}")
+                logger.error("HTTP search request failed with status %s: %s", response.status_code, response.text)
                 return []
                 
         except Exception as e:
-            logger.error(f"Direct HTTP search request failed: {e}")
+            logger.error("Direct HTTP search request failed: %s", e)
             return []
     
     def get_thread_context(self, conversation_id: str) -> Dict:
@@ -556,11 +564,10 @@ class TwitterAPI:
             # Then search for all replies in this conversation
             # Use search to find replies to this conversation
             search_query = f"conversation_id:{conversation_id}"
-            logger.info(f"Getting thread context with query: {search_query}")
+            logger.info("Getting thread context with query: %s", search_query)
             
             try:
                 # Use direct HTTP request for searching conversation tweets
-                import requests
                 
                 url = "https://api.x.com/2/tweets/search/recent"
                 headers = {
@@ -573,14 +580,14 @@ class TwitterAPI:
                     "tweet.fields": "created_at,author_id,conversation_id,in_reply_to_user_id"
                 }
                 
-                logger.info(f"Making direct HTTP request for conversation search: {url}")
+                logger.info("Making direct HTTP request for conversation search: %s", url)
                 
                 # Track this as a read call
                 TwitterAPI._read_call_count += 1
                 remaining_budget = TwitterAPI._read_call_limit - TwitterAPI._read_call_count
-                logger.warning(f"💰 API READ CALL #{TwitterAPI._read_call_count}: get_thread_context({conversation_id}) - {remaining_budget} calls remaining this month")
+                logger.warning("💰 API READ CALL #%s: get_thread_context(%s) - %s calls remaining this month", TwitterAPI._read_call_count, conversation_id, remaining_budget)
                 
-                response = requests.get(url, headers=headers, params=params)
+                response = self.session.get(url, headers=headers, params=params)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -601,21 +608,21 @@ class TwitterAPI:
                         # Sort replies by creation time (chronological order)
                         thread_context['replies'].sort(key=lambda x: x['created_at'])
                         
-                    logger.info(f"Found thread with {thread_context['total_tweets']} total tweets")
+                    logger.info("Found thread with %s total tweets", thread_context['total_tweets'])
                 elif response.status_code == 429:
-                    logger.warning(f"Rate limit hit during thread search: {response.text}")
+                    logger.warning("Rate limit hit during thread search: %s", response.text)
                 else:
-                    logger.warning(f"Thread search failed with status {response.status_code}: {response.text}")
+                    logger.warning("Thread search failed with status %s: %s", response.status_code, response.text)
                 
             except Exception as search_e:
-                logger.warning(f"Search for conversation failed: {search_e}, trying alternative method...")
+                logger.warning("Search for conversation failed: %s, trying alternative method...", search_e)
                 # If search fails, we still have the original tweet
                 pass
                 
             return thread_context
             
         except Exception as e:
-            logger.error(f"Failed to get thread context for conversation {conversation_id}: {e}")
+            logger.error("Failed to get thread context for conversation %s: %s", conversation_id, e)
             return {'original_tweet': None, 'replies': [], 'total_tweets': 0}
     
     def get_original_tweet(self, conversation_id: str) -> Optional[Dict]:
@@ -628,7 +635,6 @@ class TwitterAPI:
             Dictionary containing the original tweet data, or None if not found
         """
         try:
-            import requests
             
             # Direct HTTP request to X API v2 get tweet endpoint
             url = f"https://api.x.com/2/tweets/{conversation_id}"
@@ -642,14 +648,14 @@ class TwitterAPI:
                 "tweet.fields": "created_at,author_id,public_metrics,conversation_id"
             }
             
-            logger.info(f"Making direct HTTP request to get original tweet: {url}")
+            logger.info("Making direct HTTP request to get original tweet: %s", url)
             
             # Track this as a read call
             TwitterAPI._read_call_count += 1
             remaining_budget = TwitterAPI._read_call_limit - TwitterAPI._read_call_count
-            logger.warning(f"💰 API READ CALL #{TwitterAPI._read_call_count}: get_original_tweet({conversation_id}) - {remaining_budget} calls remaining this month")
+            logger.warning("💰 API READ CALL #%s: get_original_tweet(%s) - %s calls remaining this month", TwitterAPI._read_call_count, conversation_id, remaining_budget)
             
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             
             if response.status_code == 200:
                 data = response.json()
@@ -665,44 +671,44 @@ class TwitterAPI:
                     }
             
             elif response.status_code == 429:
-                logger.warning(f"Rate limit exceeded getting original tweet {conversation_id}")
+                logger.warning("Rate limit exceeded getting original tweet %s", conversation_id)
             else:
-                logger.error(f"Failed to get original tweet {conversation_id}: status {response.status_code}, {response.text}")
+                logger.error("Failed to get original tweet %s: status %s, %s", conversation_id, response.status_code, response.text)
             
             return None
             
         except Exception as e:
-            logger.error(f"Failed to get original tweet {conversation_id}: {e}")
+            logger.error("Failed to get original tweet %s: %s", conversation_id, e)
             return None
     
     def like_tweet(self, tweet_id: str) -> bool:
         """Like a tweet"""
         try:
             self.api_v1.create_favorite(tweet_id)
-            logger.info(f"Liked tweet {tweet_id}")
+            logger.info("Liked tweet %s", tweet_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to like tweet {tweet_id}: {e}")
+            logger.error("Failed to like tweet %s: %s", tweet_id, e)
             return False
     
     def retweet(self, tweet_id: str) -> bool:
         """Retweet a tweet"""
         try:
             self.api_v1.retweet(tweet_id)
-            logger.info(f"Retweeted {tweet_id}")
+            logger.info("Retweeted %s", tweet_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to retweet {tweet_id}: {e}")
+            logger.error("Failed to retweet %s: %s", tweet_id, e)
             return False
     
     def delete_tweet(self, tweet_id: str) -> bool:
         """Delete a tweet"""
         try:
             self.api_v1.destroy_status(tweet_id)
-            logger.info(f"Deleted tweet {tweet_id}")
+            logger.info("Deleted tweet %s", tweet_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete tweet {tweet_id}: {e}")
+            logger.error("Failed to delete tweet %s: %s", tweet_id, e)
             return False
     
     @classmethod
@@ -726,7 +732,6 @@ class TwitterAPI:
             Dict with actual usage data from X API
         """
         try:
-            import requests
             from datetime import datetime
             
             # Query the official usage endpoint (this is a read call, but necessary for accurate tracking)
@@ -737,7 +742,7 @@ class TwitterAPI:
             }
             
             logger.info("📡 Checking actual monthly API usage from X API...")
-            response = requests.get(usage_url, headers=headers)
+            response = self.session.get(usage_url, headers=headers)
             
             if response.status_code == 200:
                 data = response.json()
@@ -786,10 +791,10 @@ class TwitterAPI:
                     usage_info['rate_limit_headers'] = rate_limit_headers
                     usage_info['note'] = 'rate_limit_headers are for short-term limits (15-min), not monthly limits'
                 
-                logger.info(f"✅ Retrieved actual monthly usage: {usage_info.get('monthly_used', 'unknown')}/{usage_info.get('monthly_limit', 100)} calls")
+                logger.info("✅ Retrieved actual monthly usage: %s/%s calls", usage_info.get('monthly_used', 'unknown'), usage_info.get('monthly_limit', 100))
                 return usage_info
             else:
-                logger.warning(f"⚠️  Usage API returned {response.status_code}: {response.text[:200]}")
+                logger.warning("⚠️  Usage API returned %s: %s", response.status_code, response.text[:200])
                 return {
                     'source': 'x_api_official',
                     'error': f"HTTP {response.status_code}",
@@ -799,7 +804,7 @@ class TwitterAPI:
                 }
                 
         except Exception as e:
-            logger.error(f"❌ Error getting actual usage: {e}")
+            logger.error("❌ Error getting actual usage: %s", e)
             return {
                 'source': 'error',
                 'error': str(e),
@@ -813,7 +818,7 @@ class TwitterAPI:
         """Reset the session API call counter (only affects session counter, not actual X API usage)"""
         old_count = cls._read_call_count
         cls._read_call_count = 0
-        logger.info(f"API read call session counter reset (was {old_count}). Note: Actual X API monthly usage is not affected.")
+        logger.info("API read call session counter reset (was %s). Note: Actual X API monthly usage is not affected.", old_count)
     
     def format_verse_tweet(self, verse_data: Dict) -> str:
         """Format a Bible verse for posting on Twitter"""